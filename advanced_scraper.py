@@ -1,12 +1,27 @@
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import json
 import time
 import random
+import re
 import logging
+import threading
+import atexit
+import os
+import socket
+import mmap
+import tempfile
 import hashlib
+import heapq
 import urllib.parse
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import copy
+import contextlib
+import functools
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Any, Awaitable, Callable, ClassVar, Deque
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -33,6 +48,79 @@ except ImportError:
     HAS_SELENIUM = False
     logger.warning("Selenium not available, disabling JavaScript rendering")
 
+try:
+    import lxml.html
+    from lxml import etree
+    from bs4 import UnicodeDammit
+    HTML_PARSER = 'lxml'
+    HAS_LXML = True
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    HAS_LXML = False
+    logger.warning("lxml not available, falling back to the slower built-in html.parser")
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    logger.warning("orjson not available, using the standard json module")
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+    logger.warning("ijson not available, JSON responses will be loaded in full")
+
+try:
+    from blake3 import blake3 as content_hasher
+    HAS_BLAKE3 = True
+except ImportError:
+    content_hasher = hashlib.md5  # type: ignore[misc,assignment]
+    HAS_BLAKE3 = False
+    logger.warning("blake3 not available, using MD5 for content hashing")
+
+try:
+    from pybloom_live import ScalableBloomFilter
+    HAS_BLOOM_FILTER = True
+except ImportError:
+    HAS_BLOOM_FILTER = False
+    logger.warning("pybloom-live not available, deduplication will use in-memory sets")
+
+try:
+    import requests_cache
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+    logger.warning("requests-cache not available, HTTP response caching disabled")
+
+try:
+    from curl_cffi import requests as cffi_requests
+    HAS_CURL_CFFI = True
+except ImportError:
+    HAS_CURL_CFFI = False
+    logger.warning("curl_cffi not available, browser TLS impersonation disabled")
+
+try:
+    from sortedcontainers import SortedSet
+    HAS_SORTEDCONTAINERS = True
+except ImportError:
+    HAS_SORTEDCONTAINERS = False
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+    logger.warning("httpx not available, scrape_multiple will fetch URLs sequentially")
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 try:
     from urllib.robotparser import RobotFileParser
     HAS_ROBOTPARSER = True
@@ -49,25 +137,68 @@ class ProxyInfo:
     success_count: int = 0
     failure_count: int = 0
 
+def json_dumps(obj, indent=False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let the stdlib handle it
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Responses larger than this are not downloaded or parsed
+MAX_CONTENT_BYTES = 5 * 1024 * 1024
+
+class NonRetryableError(Exception):
+    """Raised for failures that retrying cannot fix (e.g. unsupported content)"""
+
 class RetryManager:
     """Enhanced retry logic with exponential backoff and jitter"""
     
-    def __init__(self, max_retries=3, base_delay=1):
-        self.max_retries = max_retries
-        self.base_delay = base_delay
+    def __init__(self, max_retries: int = 3, base_delay: float = 1):
+        self.max_retries: int = max_retries
+        self.base_delay: float = base_delay
     
-    def retry_with_backoff(self, func, *args, **kwargs):
+    def retry_with_backoff(self, func: Callable[..., Any], *args, **kwargs) -> Any:
         for attempt in range(self.max_retries):
             try:
                 return func(*args, **kwargs)
+            except NonRetryableError:
+                raise
             except Exception as e:
                 if attempt == self.max_retries - 1:
                     raise e
                 
                 # Exponential backoff with jitter
-                delay = self.base_delay * (2 ** attempt) + random.uniform(0, 1)
+                delay = self.base_delay * (2 ** attempt) + random.random()
                 time.sleep(delay)
                 logger.warning(f"Retry {attempt + 1}/{self.max_retries} after {delay:.2f}s")
+    
+    async def retry_with_backoff_async(self, func: Callable[..., Awaitable[Any]],
+                                       *args, **kwargs) -> Any:
+        """Awaitable variant of retry_with_backoff for coroutine functions"""
+        for attempt in range(self.max_retries):
+            try:
+                return await func(*args, **kwargs)
+            except NonRetryableError:
+                raise
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    raise e
+                
+                # Exponential backoff with jitter, without blocking the event loop
+                delay = self.base_delay * (2 ** attempt) + random.random()
+                await asyncio.sleep(delay)
+                logger.warning(f"Retry {attempt + 1}/{self.max_retries} after {delay:.2f}s")
 
 class ProxyManager:
     """Advanced proxy management with health monitoring"""
@@ -76,70 +207,166 @@ class ProxyManager:
         self.proxies = [ProxyInfo(url=proxy) for proxy in proxy_list]
         self.last_health_check = time.time()
         self.health_check_interval = 300  # 5 minutes
+        
+        # O(1) lookup by URL, plus a min-heap ordered like get_best_proxy's
+        # ranking (ties go to list order). Entries go stale when a proxy
+        # changes and are skipped lazily.
+        self._by_url: Dict[str, ProxyInfo] = {}
+        self._position: Dict[str, int] = {}
+        for position, proxy in enumerate(self.proxies):
+            if proxy.url not in self._by_url:
+                self._by_url[proxy.url] = proxy
+                self._position[proxy.url] = position
+        self._heap = [self._heap_entry(proxy) for proxy in self._by_url.values()]
+        heapq.heapify(self._heap)
+    
+    def _heap_entry(self, proxy: ProxyInfo):
+        return (proxy.response_time, -proxy.health, proxy.last_used,
+                self._position[proxy.url])
+    
+    def _push(self, proxy: ProxyInfo):
+        """Queue a proxy's current ranking, compacting stale entries if needed"""
+        heapq.heappush(self._heap, self._heap_entry(proxy))
+        if len(self._heap) > 4 * len(self._by_url) + 16:
+            self._heap = [self._heap_entry(p) for p in self._by_url.values()]
+            heapq.heapify(self._heap)
     
     def get_best_proxy(self) -> Optional[str]:
         """Get the healthiest proxy with lowest response time"""
         current_time = time.time()
         
-        # Filter healthy proxies
-        healthy_proxies = [p for p in self.proxies if p.health > 50]
+        # Pop in ranking order until a healthy proxy turns up, setting aside
+        # unhealthy ones as a fallback and dropping stale entries
+        best_proxy = None
+        unhealthy = []
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            proxy = self.proxies[entry[3]]
+            if entry != self._heap_entry(proxy):
+                continue
+            if proxy.health > 50:
+                best_proxy = proxy
+                break
+            unhealthy.append(entry)
         
-        if not healthy_proxies:
+        if best_proxy is None:
             # If no healthy proxies, use any available
-            available_proxies = [p for p in self.proxies if p.health > 0]
-            if not available_proxies:
-                return None
-            healthy_proxies = available_proxies
+            for entry in unhealthy:
+                if -entry[1] > 0:
+                    best_proxy = self.proxies[entry[3]]
+                    break
+        
+        for entry in unhealthy:
+            if best_proxy is None or self.proxies[entry[3]] is not best_proxy:
+                heapq.heappush(self._heap, entry)
+        
+        if best_proxy is None:
+            return None
         
-        # Return proxy with best performance
-        best_proxy = min(healthy_proxies, 
-                        key=lambda x: (x.response_time, -x.health, x.last_used))
         best_proxy.last_used = current_time
+        self._push(best_proxy)
         return best_proxy.url
     
     def update_proxy_performance(self, proxy_url: str, success: bool, response_time: float):
         """Update proxy performance metrics"""
-        for proxy in self.proxies:
-            if proxy.url == proxy_url:
-                if success:
-                    proxy.health = min(100, proxy.health + 5)
-                    proxy.success_count += 1
-                    proxy.response_time = response_time
-                else:
-                    proxy.health = max(0, proxy.health - 20)
-                    proxy.failure_count += 1
-                break
+        proxy = self._by_url.get(proxy_url)
+        if proxy is None:
+            return
+        
+        if success:
+            proxy.health = min(100, proxy.health + 5)
+            proxy.success_count += 1
+            proxy.response_time = response_time
+        else:
+            proxy.health = max(0, proxy.health - 20)
+            proxy.failure_count += 1
+        self._push(proxy)
 
 class AdaptiveRateLimiter:
-    """Intelligent rate limiting based on server responses"""
+    """Intelligent rate limiting based on server responses
     
-    def __init__(self, base_delay=1.0):
-        self.base_delay = base_delay
-        self.current_delay = base_delay
-        self.success_count = 0
-        self.failure_count = 0
-        self.min_delay = 0.5
-        self.max_delay = 10.0
+    Acts as a token bucket of capacity one shared by all workers, so sync
+    threads and asyncio tasks can share one limiter. A slot is booked only
+    when it is taken, with the delay current at that moment, so feedback
+    from adjust_delay() applies to requests that are already waiting.
     
-    def adjust_delay(self, success: bool, response_time: Optional[float] = None) -> float:
-        """Adjust delay based on success/failure"""
-        if success:
-            self.success_count += 1
-            self.failure_count = 0
+    A caller running up to `concurrency` requests at once spaces its slots
+    current_delay / concurrency apart, so on average `concurrency` requests
+    start per delay interval; backoff on throttling still slows them all.
+    """
+    
+    # Cap on backoff steps undone at once (1.5 ** 16 spans max/min delay)
+    MAX_IDLE_STEPS = 16
+    
+    def __init__(self, base_delay: float = 1.0):
+        self.base_delay: float = base_delay
+        self.current_delay: float = base_delay
+        self.success_count: int = 0
+        self.failure_count: int = 0
+        self.min_delay: float = 0.5
+        self.max_delay: float = 10.0
+        self._next_slot: float = 0.0
+        self._lock = threading.Lock()
+    
+    def _take(self, concurrency: int) -> float:
+        """Take the send slot if it is open, else return how long until it opens"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            if wait > 0:
+                return wait
             
-            # Speed up after consecutive successes
-            if self.success_count > 5:
-                self.current_delay = max(self.min_delay, self.current_delay * 0.9)
-        else:
-            self.failure_count += 1
-            self.success_count = 0
+            # Each whole interval left idle undoes one failure backoff, so a
+            # slowdown from an earlier call doesn't outlive the server's recovery
+            if self.current_delay > self.base_delay:
+                steps = min(int(-wait / self.current_delay), self.MAX_IDLE_STEPS)
+                self.current_delay = max(self.base_delay, self.current_delay / 1.5 ** steps)
             
-            # Slow down after failures
-            self.current_delay = min(self.max_delay, self.current_delay * 1.5)
+            # Add jitter to avoid detection
+            self._next_slot = now + self.current_delay * (0.8 + 0.4 * random.random()) / concurrency
+            return 0.0
+    
+    def acquire(self, concurrency: int = 1) -> float:
+        """Block until the caller may send its next request"""
+        waited = 0.0
+        while True:
+            wait = self._take(concurrency)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+    
+    async def acquire_async(self, concurrency: int = 1) -> float:
+        """Wait, without blocking the event loop, until a request may be sent"""
+        waited = 0.0
+        while True:
+            wait = self._take(concurrency)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+    
+    def adjust_delay(self, success: bool, response_time: Optional[float] = None) -> float:
+        """Adjust delay based on success/failure"""
+        with self._lock:
+            if success:
+                self.success_count += 1
+                self.failure_count = 0
+                
+                # Speed up after consecutive successes
+                if self.success_count > 5:
+                    self.current_delay = max(self.min_delay, self.current_delay * 0.9)
+            else:
+                self.failure_count += 1
+                self.success_count = 0
+                
+                # Slow down after failures
+                self.current_delay = min(self.max_delay, self.current_delay * 1.5)
+            delay = self.current_delay
         
         # Add jitter to avoid detection
-        jitter = random.uniform(0.8, 1.2)
-        return self.current_delay * jitter
+        jitter = 0.8 + 0.4 * random.random()
+        return delay * jitter
 
 class DataValidator:
     """Data quality validation and scoring"""
@@ -149,6 +376,11 @@ class DataValidator:
             'captcha', 'robot', 'blocked', 'access denied', 'forbidden',
             'rate limit', 'too many requests', 'bot detection'
         ]
+        # One case-insensitive alternation instead of a scan per keyword
+        self._suspicious_re = re.compile(
+            '|'.join(re.escape(keyword) for keyword in self.suspicious_keywords),
+            re.IGNORECASE
+        )
     
     def validate_scraped_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate scraped data and return quality score"""
@@ -178,8 +410,7 @@ class DataValidator:
             quality_score += 10
         
         # Check for suspicious patterns (bot detection pages)
-        content_text = ' '.join(paragraphs).lower()
-        if any(keyword in content_text for keyword in self.suspicious_keywords):
+        if any(self._suspicious_re.search(p) for p in paragraphs):
             quality_score -= 50
             issues.append("Possible bot detection page")
         
@@ -192,10 +423,14 @@ class DataValidator:
         }
 
 class PerformanceMonitor:
-    """Performance monitoring and metrics collection"""
+    """Performance monitoring and metrics collection
     
-    def __init__(self):
-        self.metrics = {
+    Safe to share between threads: recording and reading are serialized by
+    a lock so the running sums always match their windows.
+    """
+    
+    def __init__(self) -> None:
+        self.metrics: Dict[str, float] = {
             'requests_per_minute': 0,
             'average_response_time': 0,
             'success_rate': 0,
@@ -204,13 +439,22 @@ class PerformanceMonitor:
             'successful_requests': 0,
             'failed_requests': 0
         }
-        self.response_times = []
-        self.quality_scores = []
-        self.alerts = []
+        # Rolling windows of the last 100 samples, with running sums so the
+        # averages are O(1) to maintain
+        self.response_times: Deque[float] = deque(maxlen=100)
+        self.quality_scores: Deque[float] = deque(maxlen=100)
+        self._response_time_sum: float = 0.0
+        self._quality_score_sum: float = 0.0
+        self.alerts: List[str] = []
+        self._lock = threading.Lock()
     
     def record_request(self, url: str, success: bool, response_time: float, 
                       quality_score: Optional[int] = None):
         """Record request metrics"""
+        with self._lock:
+            self._record(success, response_time, quality_score)
+    
+    def _record(self, success: bool, response_time: float, quality_score: Optional[int]):
         self.metrics['total_requests'] += 1
         
         if success:
@@ -218,16 +462,18 @@ class PerformanceMonitor:
         else:
             self.metrics['failed_requests'] += 1
         
-        # Update response times
+        # Update response times (the deque evicts the oldest sample)
+        if len(self.response_times) == self.response_times.maxlen:
+            self._response_time_sum -= self.response_times[0]
         self.response_times.append(response_time)
-        if len(self.response_times) > 100:  # Keep last 100
-            self.response_times.pop(0)
+        self._response_time_sum += response_time
         
         # Update quality scores
         if quality_score is not None:
+            if len(self.quality_scores) == self.quality_scores.maxlen:
+                self._quality_score_sum -= self.quality_scores[0]
             self.quality_scores.append(quality_score)
-            if len(self.quality_scores) > 100:
-                self.quality_scores.pop(0)
+            self._quality_score_sum += quality_score
         
         # Update calculated metrics
         self._update_metrics()
@@ -243,10 +489,10 @@ class PerformanceMonitor:
             )
         
         if self.response_times:
-            self.metrics['average_response_time'] = sum(self.response_times) / len(self.response_times)
+            self.metrics['average_response_time'] = self._response_time_sum / len(self.response_times)
         
         if self.quality_scores:
-            self.metrics['average_quality_score'] = sum(self.quality_scores) / len(self.quality_scores)
+            self.metrics['average_quality_score'] = self._quality_score_sum / len(self.quality_scores)
     
     def _check_performance_alerts(self):
         """Check for performance issues"""
@@ -263,20 +509,612 @@ class PerformanceMonitor:
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics"""
-        return self.metrics.copy()
+        with self._lock:
+            return self.metrics.copy()
     
     def get_alerts(self) -> List[str]:
         """Get current alerts"""
-        return self.alerts.copy()
+        with self._lock:
+            return self.alerts.copy()
+
+class DiskSeenSet:
+    """Membership set for very large crawls that keeps memory bounded
+    
+    Keys are reduced to fixed-width 16-byte digests. Recent digests live in
+    memory; once more than max_recent accumulate they are merged, in a
+    background thread, into a sorted file on disk with a linear two-pointer
+    merge and an atomic rename. Lookups check memory first, then binary
+    search the memory-mapped file. The file persists across runs.
+    """
+    
+    DIGEST_SIZE = 16
+    
+    def __init__(self, path: str, max_recent: int = 1_000_000):
+        self.path = path
+        self.max_recent = max_recent
+        self._recent = SortedSet() if HAS_SORTEDCONTAINERS else set()
+        self._merging: frozenset = frozenset()
+        self._lock = threading.Lock()
+        self._merge_lock = threading.Lock()
+        self._merge_thread = None
+        self._file = None
+        self._mmap = None
+        self._open_disk()
+    
+    def _digest(self, key: str) -> bytes:
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=self.DIGEST_SIZE).digest()
+    
+    def _open_disk(self):
+        """(Re)map the on-disk file; called with the lock held or before sharing"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+        self._file = self._mmap = None
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            self._file = open(self.path, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def _on_disk(self, digest: bytes) -> bool:
+        """Binary search the sorted fixed-width records on disk"""
+        if self._mmap is None:
+            return False
+        size = self.DIGEST_SIZE
+        lo, hi = 0, len(self._mmap) // size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            record = self._mmap[mid * size:(mid + 1) * size]
+            if record < digest:
+                lo = mid + 1
+            elif record > digest:
+                hi = mid
+            else:
+                return True
+        return False
+    
+    def __contains__(self, key: str) -> bool:
+        digest = self._digest(key)
+        with self._lock:
+            return (digest in self._recent or digest in self._merging or
+                    self._on_disk(digest))
+    
+    def add(self, key: str):
+        digest = self._digest(key)
+        with self._lock:
+            self._recent.add(digest)
+            if len(self._recent) <= self.max_recent:
+                return
+        self._start_merge()
+    
+    def _start_merge(self):
+        # Only one merge at a time; wait for the previous run to land
+        with self._merge_lock:
+            if self._merge_thread is not None:
+                self._merge_thread.join()
+            with self._lock:
+                if not self._recent:
+                    return
+                batch = self._recent
+                self._merging = frozenset(batch)
+                self._recent = SortedSet() if HAS_SORTEDCONTAINERS else set()
+            self._merge_thread = threading.Thread(target=self._merge, args=(batch,), daemon=True)
+            self._merge_thread.start()
+    
+    def _merge(self, batch):
+        """Merge a batch of digests into the sorted file (runs in background)"""
+        size = self.DIGEST_SIZE
+        new_digests = iter(batch if HAS_SORTEDCONTAINERS else sorted(batch))
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                old = open(self.path, 'rb') if os.path.exists(self.path) else None
+                try:
+                    record = old.read(size) if old else b''
+                    digest = next(new_digests, None)
+                    while record or digest is not None:
+                        if digest is None or (record and record <= digest):
+                            if record == digest:
+                                digest = next(new_digests, None)
+                            out.write(record)
+                            record = old.read(size)
+                        else:
+                            out.write(digest)
+                            digest = next(new_digests, None)
+                finally:
+                    if old:
+                        old.close()
+            with self._lock:
+                # Unmap before replacing so the rename also works on Windows
+                if self._mmap is not None:
+                    self._mmap.close()
+                    self._file.close()
+                    self._file = self._mmap = None
+                os.replace(tmp_path, self.path)
+                self._open_disk()
+                self._merging = frozenset()
+        except Exception as e:
+            logger.error(f"Failed to merge seen set into {self.path}: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            with self._lock:
+                # Keep the batch in memory rather than forgetting it
+                self._recent.update(self._merging)
+                self._merging = frozenset()
+    
+    def close(self):
+        """Flush in-memory digests to disk and release the file"""
+        self._start_merge()
+        with self._merge_lock:
+            if self._merge_thread is not None:
+                self._merge_thread.join()
+                self._merge_thread = None
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._file.close()
+                self._file = self._mmap = None
+
+def _chrome_options(user_agent):
+    """Options for a headless Chrome suitable for scraping"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={user_agent}")
+    return chrome_options
+
+class SeleniumPool:
+    """Pool of warm headless Chrome drivers shared by scrapers
+    
+    Drivers are started on demand, up to size, and lent out one at a time
+    by borrow(); returning one clears its cookies and keeps it running, so
+    later pages and scrapers skip Chrome's cold start. All drivers are quit
+    at interpreter exit.
+    """
+    
+    def __init__(self, size: int = 2, user_agent: Optional[str] = None) -> None:
+        self.size = size
+        self.user_agent = user_agent
+        self._idle: List[Any] = []
+        # Started drivers, plus a None placeholder for each one still starting
+        self._drivers: List[Any] = []
+        # Guards both lists; notified whenever a driver or a slot frees up
+        self._available = threading.Condition()
+        atexit.register(self.close)
+    
+    def _acquire(self):
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._drivers) < self.size:
+                    # Reserve a slot before the (slow) start so the pool never overgrows
+                    self._drivers.append(None)
+                    break
+                self._available.wait()
+        
+        try:
+            driver = webdriver.Chrome(options=_chrome_options(self.user_agent))
+        except Exception:
+            with self._available:
+                self._drivers.remove(None)
+                self._available.notify()
+            raise
+        with self._available:
+            self._drivers[self._drivers.index(None)] = driver
+        logger.info(f"Selenium WebDriver {len(self._drivers)}/{self.size} started for the pool")
+        return driver
+    
+    def _release(self, driver):
+        with self._available:
+            self._idle.append(driver)
+            self._available.notify()
+    
+    def _discard(self, driver):
+        # Free the slot first so a waiting borrower can start a replacement
+        with self._available:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._available.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    @contextlib.contextmanager
+    def borrow(self):
+        """Lend out a driver, starting one if the pool has room, else waiting for one"""
+        driver = self._acquire()
+        try:
+            yield driver
+        finally:
+            try:
+                driver.delete_all_cookies()
+            except Exception:
+                # The browser died or hung; a waiting or later borrow replaces it
+                self._discard(driver)
+            else:
+                self._release(driver)
+    
+    def close(self):
+        """Quit every driver in the pool"""
+        with self._available:
+            drivers = [driver for driver in self._drivers if driver is not None]
+            self._drivers = [driver for driver in self._drivers if driver is None]
+            self._idle = []
+            self._available.notify_all()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+def _extract_title(tag, data):
+    if not data['title']:
+        data['title'] = tag.get_text().strip()
+
+def _extract_meta(tag, data):
+    if tag.get('name') == 'description' and not data['meta_description']:
+        data['meta_description'] = tag.get('content', '').strip()
+
+def _extract_heading(tag, data):
+    data['headings'].append({
+        'level': int(tag.name[1]),
+        'text': tag.get_text().strip()
+    })
+
+def _extract_paragraph(tag, data):
+    text = tag.get_text().strip()
+    if text and len(text) > 10:  # Filter out short paragraphs
+        data['paragraphs'].append(text)
+
+def _extract_link(tag, data):
+    href = tag.get('href')
+    if href is None:
+        return
+    href = href.strip()
+    text = tag.get_text().strip()
+    if href and text:
+        data['links'].append({
+            'url': href,
+            'text': text
+        })
+
+def _extract_image(tag, data):
+    src = tag.get('src', '').strip()
+    alt = tag.get('alt', '').strip()
+    if src:
+        data['images'].append({
+            'src': src,
+            'alt': alt
+        })
+
+def _extract_json_ld(tag, data):
+    # Structured data (JSON-LD)
+    if tag.get('type') != 'application/ld+json' or not tag.string:
+        return
+    try:
+        # str() because orjson rejects str subclasses such as NavigableString
+        data['structured_data'].append(json_loads(str(tag.string)))
+    except ValueError:
+        pass
+
+# Tag name -> extractor, so extract_data visits each node only once
+_TAG_EXTRACTORS: Dict[Optional[str], Callable[[Any, Dict[str, Any]], None]] = {
+    'title': _extract_title,
+    'meta': _extract_meta,
+    'h1': _extract_heading,
+    'h2': _extract_heading,
+    'h3': _extract_heading,
+    'h4': _extract_heading,
+    'h5': _extract_heading,
+    'h6': _extract_heading,
+    'p': _extract_paragraph,
+    'a': _extract_link,
+    'img': _extract_image,
+    'script': _extract_json_ld,
+}
+
+def _extract_page_data(soup, url, extractors=_TAG_EXTRACTORS):
+    """Extract comprehensive data from parsed HTML"""
+    if not soup:
+        return None
+    
+    data = {
+        'url': url,
+        'title': '',
+        'meta_description': '',
+        'headings': [],
+        'paragraphs': [],
+        'links': [],
+        'images': [],
+        'structured_data': [],
+        'content_hash': ''
+    }
+    
+    # Walk the tree once, dispatching each tag to its extractor. Text nodes
+    # have no name and go to the extractor registered under None, if any.
+    for element in soup.descendants:
+        extractor = extractors.get(element.name)
+        if extractor:
+            extractor(element, data)
+    
+    # Keep headings grouped by level (h1 first), as callers expect
+    data['headings'].sort(key=lambda heading: heading['level'])
+    
+    data['content_hash'] = _content_hash(data['paragraphs'])
+    return data
+
+# Above this much paragraph text, hash with BLAKE3's multi-threaded mode
+THREADED_HASH_THRESHOLD = 1024 * 1024
+
+def _content_hash(paragraphs):
+    """Content hash for deduplication, fed paragraph by paragraph instead
+    of building the joined text"""
+    if HAS_BLAKE3 and sum(len(p) for p in paragraphs) >= THREADED_HASH_THRESHOLD:
+        # BLAKE3 only parallelizes within a single large update, so this is
+        # the one case where joining first pays off (same digest either way)
+        content = ' '.join(paragraphs).encode('utf-8')
+        return content_hasher(content, max_threads=content_hasher.AUTO).hexdigest()
+    
+    hasher = content_hasher()
+    for i, paragraph in enumerate(paragraphs):
+        if i:
+            hasher.update(b' ')
+        hasher.update(paragraph.encode('utf-8'))
+    return hasher.hexdigest()
+
+if HAS_LXML:
+    # Every node extract_data cares about, selected in one document-order
+    # pass by libxml2
+    _LXML_NODES = etree.XPath(' | '.join([
+        '//title',
+        '//meta[@name="description"]',
+        '//h1', '//h2', '//h3', '//h4', '//h5', '//h6',
+        '//p',
+        '//a[@href]',
+        '//img',
+        '//script[@type="application/ld+json"]',
+    ]))
+    _LXML_PARSERS: Dict[str, Any] = {}
+
+def _lxml_parser(encoding):
+    parser = _LXML_PARSERS.get(encoding)
+    if parser is None:
+        parser = _LXML_PARSERS[encoding] = lxml.html.HTMLParser(encoding=encoding)
+    return parser
+
+def _blank_hidden_text(tree):
+    """Clear text inside script, style and template elements, which bs4's
+    get_text() skips; the elements themselves (and their tails) stay"""
+    for container in tree.iter('script', 'style', 'template'):
+        container.text = None
+        for child in container.iterdescendants():
+            child.text = None
+            child.tail = None
+
+def _extract_page_data_lxml(html_content, url):
+    """Fast path for _extract_page_data working on lxml trees via XPath
+    
+    Produces the same data as the BeautifulSoup path. Returns None if lxml
+    can't handle the input, in which case callers should fall back.
+    """
+    if isinstance(html_content, bytes):
+        # Detect the encoding the same way BeautifulSoup does
+        encoding = UnicodeDammit(html_content, is_html=True).original_encoding or 'utf-8'
+        body = html_content
+    else:
+        encoding = 'utf-8'
+        body = html_content.encode('utf-8')
+    
+    try:
+        tree = lxml.html.document_fromstring(body, parser=_lxml_parser(encoding))
+    except (etree.ParserError, ValueError, LookupError):
+        return None
+    
+    data = {
+        'url': url,
+        'title': '',
+        'meta_description': '',
+        'headings': [],
+        'paragraphs': [],
+        'links': [],
+        'images': [],
+        'structured_data': [],
+        'content_hash': ''
+    }
+    
+    nodes = _LXML_NODES(tree)
+    # Read JSON-LD before blanking script text, then walk everything else
+    for node in nodes:
+        if node.tag == 'script' and node.text:
+            try:
+                data['structured_data'].append(json_loads(node.text))
+            except ValueError:
+                pass
+    _blank_hidden_text(tree)
+    
+    for node in nodes:
+        tag = node.tag
+        if tag == 'script':
+            continue
+        if tag == 'p':
+            text = node.text_content().strip()
+            if text and len(text) > 10:  # Filter out short paragraphs
+                data['paragraphs'].append(text)
+        elif tag == 'a':
+            href = node.get('href').strip()
+            text = node.text_content().strip()
+            if href and text:
+                data['links'].append({'url': href, 'text': text})
+        elif tag == 'img':
+            src = node.get('src', '').strip()
+            if src:
+                data['images'].append({'src': src, 'alt': node.get('alt', '').strip()})
+        elif tag == 'title':
+            if not data['title']:
+                data['title'] = node.text_content().strip()
+        elif tag == 'meta':
+            if not data['meta_description']:
+                data['meta_description'] = node.get('content', '').strip()
+        else:
+            data['headings'].append({'level': int(tag[1]), 'text': node.text_content().strip()})
+    
+    data['headings'].sort(key=lambda heading: heading['level'])
+    data['content_hash'] = _content_hash(data['paragraphs'])
+    return data
+
+def _parse_and_extract(html_content, url):
+    """Parse and extract a page; module-level so it can run in a worker process"""
+    if not html_content:
+        return None
+    if HAS_LXML:
+        data = _extract_page_data_lxml(html_content, url)
+        if data is not None:
+            return data
+    return _extract_page_data(BeautifulSoup(html_content, HTML_PARSER), url)
+
+def _is_throttled(status_code):
+    """Whether a response status signals that we should slow down"""
+    return status_code == 429 or status_code >= 500
+
+def _check_content_headers(headers):
+    """Reject responses that are not markup or exceed MAX_CONTENT_BYTES"""
+    content_type = headers.get('Content-Type', '').lower()
+    if content_type and 'html' not in content_type and 'xml' not in content_type:
+        raise NonRetryableError(f"Unsupported content type: {content_type}")
+    
+    content_length = headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > MAX_CONTENT_BYTES:
+        raise NonRetryableError(f"Response too large: {content_length} bytes")
+
+def _json_prefix_items(obj, prefix):
+    """Return the values under an ijson-style prefix of an already parsed document"""
+    nodes = [obj]
+    for part in prefix.split('.') if prefix else []:
+        matched = []
+        for node in nodes:
+            if part == 'item' and isinstance(node, list):
+                matched.extend(node)
+            elif isinstance(node, dict) and part in node:
+                matched.append(node[part])
+        nodes = matched
+    return nodes
+
+def _new_seen_filter():
+    """Create a membership filter for deduplication (Bloom filter if available)"""
+    if HAS_BLOOM_FILTER:
+        return ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-4)
+    return set()
+
+# Query parameters that only track the visit and never change the page
+TRACKING_PARAMS = frozenset({'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', '_ga'})
+
+@functools.lru_cache(maxsize=4096)
+def normalize_url(url):
+    """Canonicalize a URL for deduplication
+    
+    Lowercases the scheme and host, drops the fragment, default port and
+    tracking parameters (utm_* and TRACKING_PARAMS), and sorts the query.
+    """
+    parsed = urllib.parse.urlsplit(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    if (scheme, netloc.rpartition(':')[2]) in (('http', '80'), ('https', '443')):
+        netloc = netloc.rpartition(':')[0]
+    
+    query = parsed.query
+    if query:
+        params = [
+            (key, value)
+            for key, value in urllib.parse.parse_qsl(query, keep_blank_values=True)
+            if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+        ]
+        query = urllib.parse.urlencode(sorted(params))
+    
+    return urllib.parse.urlunsplit((scheme, netloc, parsed.path or '/', query, ''))
+
+@functools.lru_cache(maxsize=4096)
+def _url_origin(url):
+    """(scheme, netloc) of a URL, which robots.txt rules are scoped to"""
+    parsed = urllib.parse.urlsplit(url)
+    return parsed.scheme, parsed.netloc
+
+# Process-wide getaddrinfo results as key -> (resolved_at, addresses), LRU-bounded
+DNS_CACHE_TTL = 300
+DNS_CACHE_SIZE = 4096
+_dns_cache: OrderedDict = OrderedDict()
+_dns_lock = threading.Lock()
+_system_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo, answering repeat lookups from _dns_cache for DNS_CACHE_TTL"""
+    # Some clients pass the host IDNA-encoded as bytes
+    name = host.decode('idna') if isinstance(host, bytes) else host
+    key = (name.lower() if name else name, port, family, type, proto, flags)
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+        if cached and time.monotonic() - cached[0] < DNS_CACHE_TTL:
+            _dns_cache.move_to_end(key)
+            return list(cached[1])
+    
+    addresses = _system_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_lock:
+        _dns_cache[key] = (time.monotonic(), addresses)
+        _dns_cache.move_to_end(key)
+        while len(_dns_cache) > DNS_CACHE_SIZE:
+            _dns_cache.popitem(last=False)
+    return list(addresses)
+
+def install_dns_cache():
+    """Route every socket.getaddrinfo call in the process through the DNS cache"""
+    socket.getaddrinfo = _cached_getaddrinfo
 
 class AdvancedWebScraper:
+    # Process-wide session whose connection pool (and TLS sessions) is
+    # reused by every instance created with share_session=True
+    _shared_session: ClassVar[Optional[requests.Session]] = None
+    _shared_session_lock: ClassVar[threading.Lock] = threading.Lock()
+    _selenium_pool: ClassVar[Optional[SeleniumPool]] = None
+    
+    # Tag name -> extractor(tag, data) run by extract_data's single pass over
+    # the tree; subclasses can extend it to collect extra fields in that pass
+    tag_extractors: ClassVar[Dict[Optional[str], Callable[[Any, Dict[str, Any]], None]]] = _TAG_EXTRACTORS
+    
     def __init__(self, use_proxies=False, proxy_list=None, ignore_robots=True, 
-                 use_selenium=False, max_retries=3):
-        self.session = requests.Session()
+                 use_selenium=False, max_retries=3, deduplicate=False,
+                 use_cache=False, cache_backend='sqlite', parse_workers=0,
+                 share_session=False, impersonate=None, dedup_store_path=None,
+                 dns_cache=False, selenium_pool_size=0):
+        self.use_cache = use_cache and HAS_REQUESTS_CACHE
+        if self.use_cache:
+            # Persistent HTTP cache; expired entries are revalidated with
+            # If-None-Match/If-Modified-Since so unchanged pages return 304
+            self.session = requests_cache.CachedSession(
+                'scraper_cache',
+                backend=cache_backend,
+                expire_after=3600,
+                cache_control=True,
+                stale_if_error=True
+            )
+        elif impersonate and HAS_CURL_CFFI:
+            # Present a real browser's TLS/HTTP2 fingerprint (e.g. "chrome124")
+            # so fewer requests get blocked and retried
+            self.session = cffi_requests.Session(impersonate=impersonate)
+        elif share_session:
+            self.session = self._get_shared_session()
+        else:
+            self.session = requests.Session()
+        self.impersonate = impersonate if HAS_CURL_CFFI and not self.use_cache else None
+        self.share_session = share_session and not (self.use_cache or self.impersonate)
         self.use_proxies = use_proxies
         self.ignore_robots = ignore_robots
         self.use_selenium = use_selenium and HAS_SELENIUM
         self.driver = None
+        self.selenium_pool_size = selenium_pool_size
+        self.selenium_pool = None
         
         # Set up user agent
         if HAS_FAKE_USERAGENT:
@@ -296,9 +1134,77 @@ class AdvancedWebScraper:
         self.data_validator = DataValidator()
         self.performance_monitor = PerformanceMonitor()
         
+        # Seen URLs and content hashes, used to skip repeats when deduplicating.
+        # With dedup_store_path they spill to sorted files on disk instead.
+        self.deduplicate = deduplicate
+        self._seen_urls = self._seen_hashes = None
+        if deduplicate and dedup_store_path:
+            self._seen_urls = DiskSeenSet(f"{dedup_store_path}.urls")
+            self._seen_hashes = DiskSeenSet(f"{dedup_store_path}.content")
+        elif deduplicate:
+            self._seen_urls = _new_seen_filter()
+            self._seen_hashes = _new_seen_filter()
+        
+        # robots.txt parsers per (scheme, host) as (parser, fetched_at), LRU-bounded
+        self._robots_cache = OrderedDict()
+        self._robots_host_locks = {}
+        self._robots_lock = threading.Lock()
+        self.robots_cache_ttl = 24 * 3600
+        self.robots_cache_size = 1024
+        
+        # Parsed page data keyed on (url, body hash), so cached/unchanged
+        # responses skip parsing and extraction
+        self._parsed_cache = OrderedDict() if self.use_cache else None
+        self._parsed_cache_size = 1000
+        
+        # Without custom parse_html/extract_data/tag_extractors overrides, pages
+        # can go through the module-level lxml fast path (and worker processes)
+        self._default_extraction = (
+            type(self).parse_html is AdvancedWebScraper.parse_html and
+            type(self).extract_data is AdvancedWebScraper.extract_data and
+            type(self).tag_extractors is AdvancedWebScraper.tag_extractors
+        )
+        
+        # Optional process pool for CPU-bound parsing in scrape_multiple_async.
+        # Custom overrides can't be shipped to worker processes, so subclasses
+        # that define them always parse in-process.
+        self._parse_pool = None
+        if parse_workers:
+            if self._default_extraction:
+                self._parse_pool = ProcessPoolExecutor(max_workers=parse_workers)
+            else:
+                logger.warning("parse_workers ignored: custom extraction overrides run in-process")
+        
+        # Optional process-wide DNS cache, pre-filled per URL list by
+        # scrape_multiple. curl_cffi resolves inside libcurl, and with
+        # proxies the proxy does the lookups, so warming is skipped then.
+        self.dns_cache = dns_cache
+        if dns_cache:
+            install_dns_cache()
+        
         if self.use_selenium:
             self._setup_selenium()
     
+    @classmethod
+    def _get_shared_session(cls):
+        """Get (creating on first use) the session shared across instances"""
+        with cls._shared_session_lock:
+            if AdvancedWebScraper._shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=100, pool_maxsize=100, max_retries=0)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                AdvancedWebScraper._shared_session = session
+            return AdvancedWebScraper._shared_session
+    
+    @classmethod
+    def _get_selenium_pool(cls, size, user_agent):
+        """Get (creating on first use) the driver pool shared across instances"""
+        with cls._shared_session_lock:
+            if AdvancedWebScraper._selenium_pool is None:
+                AdvancedWebScraper._selenium_pool = SeleniumPool(size, user_agent)
+            return AdvancedWebScraper._selenium_pool
+    
     def _setup_selenium(self):
         """Setup headless Chrome browser for JavaScript rendering"""
         if not HAS_SELENIUM:
@@ -307,15 +1213,17 @@ class AdvancedWebScraper:
             return
             
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument(f"--user-agent={self._get_user_agent()}")
+            if self.selenium_pool_size:
+                self.selenium_pool = self._get_selenium_pool(
+                    self.selenium_pool_size, self._get_user_agent()
+                )
+                # Start (or check) a pooled driver now, as the unpooled path does
+                with self.selenium_pool.borrow():
+                    pass
+                logger.info("Using the shared Selenium WebDriver pool")
+                return
             
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = webdriver.Chrome(options=_chrome_options(self._get_user_agent()))
             logger.info("Selenium WebDriver initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Selenium WebDriver: {e}")
@@ -353,18 +1261,41 @@ class AdvancedWebScraper:
             return self.proxy_manager.get_best_proxy()
         return None
 
+    def _get_robots_parser(self, key):
+        """Get the robots.txt parser for a (scheme, netloc), fetching it at most once per TTL"""
+        
+        # One lock per host so concurrent first requests fetch robots.txt once
+        with self._robots_lock:
+            host_lock = self._robots_host_locks.setdefault(key, threading.Lock())
+        
+        with host_lock:
+            with self._robots_lock:
+                cached = self._robots_cache.get(key)
+                if cached and time.monotonic() - cached[1] < self.robots_cache_ttl:
+                    self._robots_cache.move_to_end(key)
+                    return cached[0]
+            
+            rp = RobotFileParser()
+            rp.set_url(f"{key[0]}://{key[1]}/robots.txt")
+            rp.read()
+            
+            with self._robots_lock:
+                self._robots_cache[key] = (rp, time.monotonic())
+                self._robots_cache.move_to_end(key)
+                # Evict the least recently used hosts beyond the size limit
+                while len(self._robots_cache) > self.robots_cache_size:
+                    evicted, _ = self._robots_cache.popitem(last=False)
+                    self._robots_host_locks.pop(evicted, None)
+            return rp
+
     def _check_robots_txt(self, url):
         """Check if URL is allowed by robots.txt (if not ignoring)"""
         if self.ignore_robots or not HAS_ROBOTPARSER:
             return True
         
         try:
-            parsed_url = urllib.parse.urlparse(url)
-            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
-            
-            rp = RobotFileParser()
-            rp.set_url(robots_url)
-            rp.read()
+            # robots.txt only applies to the scheme and host it was served from
+            rp = self._get_robots_parser(_url_origin(url))
             
             user_agent = self._get_user_agent()
             allowed = rp.can_fetch(user_agent, url)
@@ -385,7 +1316,18 @@ class AdvancedWebScraper:
             proxies = {'http': proxy, 'https': proxy} if proxy else None
             
             start_time = time.time()
-            response = self.session.get(url, headers=headers, proxies=proxies, timeout=30)
+            response = self.session.get(url, headers=headers, proxies=proxies, timeout=30,
+                                        stream=True)
+            with contextlib.closing(response):
+                # Check headers before pulling the body through Python
+                if response.ok:
+                    _check_content_headers(response.headers)
+                
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    body += chunk
+                    if len(body) > MAX_CONTENT_BYTES:
+                        raise NonRetryableError(f"Response too large: over {MAX_CONTENT_BYTES} bytes")
             response_time = time.time() - start_time
             
             # Update proxy performance
@@ -393,27 +1335,94 @@ class AdvancedWebScraper:
                 success = response.status_code == 200
                 self.proxy_manager.update_proxy_performance(proxy, success, response_time)
             
+            # Back off on throttling/server errors, speed up otherwise
+            self.rate_limiter.adjust_delay(not _is_throttled(response.status_code), response_time)
+            
             response.raise_for_status()
-            return response.text, response_time
+            # Raw bytes let the parser detect the document's own encoding
+            return bytes(body), response_time
         
         return self.retry_manager.retry_with_backoff(_fetch)
 
+    async def fetch_page_httpx(self, url, client):
+        """Fetch page using a shared httpx.AsyncClient"""
+        async def _fetch():
+            start_time = time.time()
+            headers = self._get_headers()
+            # HTTP/2 forbids connection-specific headers; httpx manages keep-alive itself
+            headers.pop('Connection', None)
+            async with client.stream('GET', url, headers=headers,
+                                     timeout=30) as response:
+                # Check headers before pulling the body through Python
+                if response.is_success:
+                    _check_content_headers(response.headers)
+                
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) > MAX_CONTENT_BYTES:
+                        raise NonRetryableError(f"Response too large: over {MAX_CONTENT_BYTES} bytes")
+            response_time = time.time() - start_time
+            
+            self.rate_limiter.adjust_delay(not _is_throttled(response.status_code), response_time)
+            
+            response.raise_for_status()
+            # Raw bytes let the parser detect the document's own encoding
+            return bytes(body), response_time
+        
+        return await self.retry_manager.retry_with_backoff_async(_fetch)
+
+    def iter_json_items(self, url, prefix='item'):
+        """Yield the records under prefix of a JSON response, streaming the body with ijson"""
+        if not self._check_robots_txt(url):
+            logger.warning(f"Skipping {url} due to robots.txt restrictions")
+            return
+        
+        def _open():
+            start_time = time.time()
+            response = self.session.get(url, headers=self._get_headers(), timeout=30,
+                                        stream=True)
+            response_time = time.time() - start_time
+            self.rate_limiter.adjust_delay(not _is_throttled(response.status_code), response_time)
+            if not response.ok:
+                response.close()
+                response.raise_for_status()
+            return response, response_time
+        
+        response, response_time = self.retry_manager.retry_with_backoff(_open)
+        with contextlib.closing(response):
+            raw = getattr(response, 'raw', None)
+            if HAS_IJSON and hasattr(raw, 'read'):
+                # Parse while the body downloads; only one record is held at a time
+                raw.decode_content = True
+                yield from ijson.items(raw, prefix, use_float=True)
+            else:
+                yield from _json_prefix_items(json_loads(response.content), prefix)
+        
+        self.performance_monitor.record_request(url, True, response_time)
+
     def fetch_page_selenium(self, url):
         """Fetch page using Selenium with enhanced error handling"""
-        def _fetch():
-            if not self.driver:
-                raise Exception("Selenium driver not initialized")
-            
+        def _load(driver):
             start_time = time.time()
-            self.driver.get(url)
+            driver.get(url)
             
             # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
             response_time = time.time() - start_time
-            return self.driver.page_source, response_time
+            return driver.page_source, response_time
+        
+        def _fetch():
+            if self.selenium_pool:
+                with self.selenium_pool.borrow() as driver:
+                    return _load(driver)
+            
+            if not self.driver:
+                raise Exception("Selenium driver not initialized")
+            return _load(self.driver)
         
         return self.retry_manager.retry_with_backoff(_fetch)
 
@@ -427,86 +1436,14 @@ class AdvancedWebScraper:
     def parse_html(self, html_content):
         """Parse HTML content"""
         if html_content:
-            return BeautifulSoup(html_content, 'html.parser')  # Use built-in parser as fallback
+            return BeautifulSoup(html_content, HTML_PARSER)
         return None
 
     def extract_data(self, soup, url):
         """Extract comprehensive data from parsed HTML"""
-        if not soup:
-            return None
-        
-        data = {
-            'url': url,
-            'title': '',
-            'meta_description': '',
-            'headings': [],
-            'paragraphs': [],
-            'links': [],
-            'images': [],
-            'structured_data': [],
-            'content_hash': ''
-        }
-        
-        # Extract title
-        title_tag = soup.find('title')
-        if title_tag:
-            data['title'] = title_tag.get_text().strip()
-        
-        # Extract meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc:
-            data['meta_description'] = meta_desc.get('content', '').strip()
-        
-        # Extract headings
-        for i in range(1, 7):
-            for heading in soup.find_all(f'h{i}'):
-                data['headings'].append({
-                    'level': i,
-                    'text': heading.get_text().strip()
-                })
-        
-        # Extract paragraphs
-        for p in soup.find_all('p'):
-            text = p.get_text().strip()
-            if text and len(text) > 10:  # Filter out short paragraphs
-                data['paragraphs'].append(text)
-        
-        # Extract links
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '').strip()
-            text = link.get_text().strip()
-            if href and text:
-                data['links'].append({
-                    'url': href,
-                    'text': text
-                })
-        
-        # Extract images
-        for img in soup.find_all('img'):
-            src = img.get('src', '').strip()
-            alt = img.get('alt', '').strip()
-            if src:
-                data['images'].append({
-                    'src': src,
-                    'alt': alt
-                })
-        
-        # Extract structured data (JSON-LD)
-        for script in soup.find_all('script', type='application/ld+json'):
-            try:
-                if script.string:
-                    structured_data = json.loads(script.string)
-                    data['structured_data'].append(structured_data)
-            except:
-                continue
-        
-        # Generate content hash for deduplication
-        content_text = ' '.join(data['paragraphs'])
-        data['content_hash'] = hashlib.md5(content_text.encode()).hexdigest()
-        
-        return data
+        return _extract_page_data(soup, url, self.tag_extractors)
 
-    def scrape(self, url):
+    def scrape(self, url, bypass_cache=False):
         """Scrape a single URL with enhanced error handling and monitoring"""
         logger.info(f"Scraping: {url}")
         
@@ -514,10 +1451,75 @@ class AdvancedWebScraper:
             logger.warning(f"Skipping {url} due to robots.txt restrictions")
             return None
         
+        if self._is_duplicate_url(url):
+            logger.info(f"Skipping {url}, already fetched")
+            return None
+        
         try:
             # Fetch page
-            html_content, response_time = self.fetch_page(url)
+            if bypass_cache and self.use_cache:
+                cache_context = self.session.cache_disabled()
+            else:
+                cache_context = contextlib.nullcontext()
+            with cache_context:
+                html_content, response_time = self.fetch_page(url)
+            return self._process_page(url, html_content, response_time)
             
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {e}")
+            self.performance_monitor.record_request(url, False, 0)
+            return None
+
+    def _is_duplicate_url(self, url):
+        """Check (and remember) whether the normalized URL has been fetched"""
+        if self._seen_urls is None:
+            return False
+        
+        key = normalize_url(url)
+        if key in self._seen_urls:
+            return True
+        self._seen_urls.add(key)
+        return False
+
+    def _is_duplicate_content(self, data):
+        """Check (and remember) whether the page content has been seen"""
+        if self._seen_hashes is None:
+            return False
+        
+        if data['content_hash'] in self._seen_hashes:
+            return True
+        self._seen_hashes.add(data['content_hash'])
+        return False
+
+    def _get_cached_parse(self, url, html_content):
+        """Return (cache key, cached page data or None) for a fetched body"""
+        if self._parsed_cache is None or not html_content:
+            return None, None
+        
+        body = html_content if isinstance(html_content, bytes) else html_content.encode('utf-8')
+        parsed_key = (url, content_hasher(body).hexdigest())
+        cached = self._parsed_cache.get(parsed_key)
+        if cached is None:
+            return parsed_key, None
+        self._parsed_cache.move_to_end(parsed_key)
+        return parsed_key, copy.deepcopy(cached)
+
+    def _store_cached_parse(self, parsed_key, data):
+        if parsed_key is not None:
+            self._parsed_cache[parsed_key] = copy.deepcopy(data)
+            if len(self._parsed_cache) > self._parsed_cache_size:
+                self._parsed_cache.popitem(last=False)
+
+    def _process_page(self, url, html_content, response_time):
+        """Parse, extract and validate fetched HTML, recording metrics"""
+        parsed_key, data = self._get_cached_parse(url, html_content)
+        
+        if data is None and self._default_extraction and HAS_LXML and html_content:
+            data = _extract_page_data_lxml(html_content, url)
+            if data is not None:
+                self._store_cached_parse(parsed_key, data)
+        
+        if data is None:
             # Parse HTML
             soup = self.parse_html(html_content)
             if not soup:
@@ -532,42 +1534,170 @@ class AdvancedWebScraper:
                 self.performance_monitor.record_request(url, False, response_time)
                 return None
             
-            # Validate data quality
-            validation_result = self.data_validator.validate_scraped_data(data)
-            data['validation'] = validation_result
-            
-            # Record successful request
-            self.performance_monitor.record_request(
-                url, True, response_time, validation_result['quality_score']
+            self._store_cached_parse(parsed_key, data)
+        
+        return self._finish_page(url, data, response_time)
+
+    async def _process_page_async(self, url, html_content, response_time):
+        """Like _process_page, but parses in the worker process pool if enabled"""
+        if self._parse_pool is None:
+            return self._process_page(url, html_content, response_time)
+        
+        parsed_key, data = self._get_cached_parse(url, html_content)
+        
+        if data is None:
+            # Only the raw body and the extracted dict cross the process boundary
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(
+                self._parse_pool, _parse_and_extract, html_content, url
             )
+            if not data:
+                logger.error(f"Failed to parse HTML for {url}")
+                self.performance_monitor.record_request(url, False, response_time)
+                return None
             
-            logger.info(f"Successfully scraped {url} (Quality: {validation_result['quality_score']})")
-            return data
-            
-        except Exception as e:
-            logger.error(f"Error scraping {url}: {e}")
-            self.performance_monitor.record_request(url, False, 0)
+            self._store_cached_parse(parsed_key, data)
+        
+        return self._finish_page(url, data, response_time)
+
+    def _finish_page(self, url, data, response_time):
+        """Deduplicate and validate extracted data, recording metrics"""
+        if self._is_duplicate_content(data):
+            logger.info(f"Skipping {url}, duplicate content ({data['content_hash']})")
+            self.performance_monitor.record_request(url, True, response_time)
             return None
+        
+        # Validate data quality
+        validation_result = self.data_validator.validate_scraped_data(data)
+        data['validation'] = validation_result
+        
+        # Record successful request
+        self.performance_monitor.record_request(
+            url, True, response_time, validation_result['quality_score']
+        )
+        
+        logger.info(f"Successfully scraped {url} (Quality: {validation_result['quality_score']})")
+        return data
 
-    def scrape_multiple(self, urls):
-        """Scrape multiple URLs with progress tracking"""
+    def warm_dns(self, urls):
+        """Resolve every distinct host in urls once, in parallel, to fill the DNS cache"""
+        if not self.dns_cache or self.proxy_manager or self.impersonate:
+            return
+        
+        targets = set()
+        for url in urls:
+            parsed = urllib.parse.urlsplit(url)
+            try:
+                port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+            except ValueError:
+                continue
+            if parsed.hostname:
+                targets.add((parsed.hostname, port))
+        
+        def _resolve(target):
+            # Same arguments urllib3 and httpx use, so their lookups hit the cache
+            try:
+                socket.getaddrinfo(target[0], target[1], 0, socket.SOCK_STREAM)
+            except OSError as e:
+                logger.warning(f"DNS warm-up failed for {target[0]}: {e}")
+        
+        if targets:
+            with ThreadPoolExecutor(max_workers=min(16, len(targets))) as executor:
+                list(executor.map(_resolve, targets))
+
+    def scrape_multiple(self, urls, on_result=None, on_error=None, concurrency=32):
+        """Scrape multiple URLs with progress tracking
+        
+        As each URL finishes, its page data is passed to on_result, or the
+        URL to on_error if it was skipped or failed.
+        """
+        # Fetch concurrently when the plain, uncached HTTP path is in use and
+        # no event loop is already running in this thread
+        if HAS_HTTPX and not (self.use_selenium or self.proxy_manager or self.use_cache
+                              or self.impersonate):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.scrape_multiple_async(
+                    urls, concurrency=concurrency, on_result=on_result, on_error=on_error
+                ))
+        
         results = []
         total_urls = len(urls)
         
         logger.info(f"Starting to scrape {total_urls} URLs")
+        self.warm_dns(urls)
         
         for i, url in enumerate(urls, 1):
             logger.info(f"Progress: {i}/{total_urls} - {url}")
             
+            # Wait for the next rate-limit slot
+            self.rate_limiter.acquire()
+            
             data = self.scrape(url)
             if data:
                 results.append(data)
+                if on_result:
+                    on_result(data)
+            elif on_error:
+                on_error(url)
+        
+        logger.info(f"Completed scraping. Success: {len(results)}/{total_urls}")
+        return results
+
+    async def scrape_multiple_async(self, urls, concurrency=32, on_result=None, on_error=None):
+        """Scrape multiple URLs concurrently over a shared HTTP/2 connection pool
+        
+        Up to `concurrency` requests are in flight, and the rate limiter lets
+        about that many start per delay interval, so throughput scales with
+        concurrency instead of being capped at one request per delay.
+        """
+        if not HAS_HTTPX:
+            raise RuntimeError("httpx is required for asynchronous scraping")
+        
+        total_urls = len(urls)
+        logger.info(f"Starting to scrape {total_urls} URLs (concurrency: {concurrency})")
+        await asyncio.to_thread(self.warm_dns, urls)
+        
+        sem = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        transport = httpx.AsyncHTTPTransport(http2=HAS_HTTP2, limits=limits, retries=0)
+        
+        async with httpx.AsyncClient(transport=transport, follow_redirects=True) as client:
+            async def _scrape_one(url):
+                logger.info(f"Scraping: {url}")
+                
+                if not await asyncio.to_thread(self._check_robots_txt, url):
+                    logger.warning(f"Skipping {url} due to robots.txt restrictions")
+                    return None
+                
+                if self._is_duplicate_url(url):
+                    logger.info(f"Skipping {url}, already fetched")
+                    return None
+                
+                try:
+                    await self.rate_limiter.acquire_async(concurrency)
+                    html_content, response_time = await self.fetch_page_httpx(url, client)
+                    return await self._process_page_async(url, html_content, response_time)
+                except Exception as e:
+                    logger.error(f"Error scraping {url}: {e}")
+                    self.performance_monitor.record_request(url, False, 0)
+                    return None
             
-            # Add delay between requests
-            if i < total_urls:
-                delay = self.rate_limiter.adjust_delay(True)
-                time.sleep(delay)
+            async def _bounded(url):
+                async with sem:
+                    data = await _scrape_one(url)
+                
+                if data:
+                    if on_result:
+                        on_result(data)
+                elif on_error:
+                    on_error(url)
+                return data
+            
+            pages = await asyncio.gather(*[_bounded(url) for url in urls])
         
+        results = [data for data in pages if data]
         logger.info(f"Completed scraping. Success: {len(results)}/{total_urls}")
         return results
 
@@ -583,8 +1713,8 @@ class AdvancedWebScraper:
             'data': data
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(json_dumps(output_data, indent=True))
         
         logger.info(f"Data saved to {filename}")
 
@@ -598,14 +1728,24 @@ class AdvancedWebScraper:
 
     def close(self):
         """Clean up resources"""
+        if self._parse_pool:
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
+        
+        for seen in (self._seen_urls, self._seen_hashes):
+            if isinstance(seen, DiskSeenSet):
+                seen.close()
+        
         if self.driver:
             try:
                 self.driver.quit()
                 logger.info("Selenium WebDriver closed")
             except:
                 pass
+        # Pooled drivers stay warm for other scrapers; the pool quits them at exit
         
-        if self.session:
+        # The shared session outlives individual scrapers
+        if self.session and not self.share_session:
             try:
                 self.session.close()
                 logger.info("Requests session closed")
@@ -7,11 +7,29 @@ for different scenarios and use cases, including the new performance monitoring,
 data validation, and advanced error handling features.
 """
 
-from advanced_scraper import AdvancedWebScraper
+from advanced_scraper import AdvancedWebScraper, AdaptiveRateLimiter, HAS_HTTPX, json_dumps, normalize_url
+from bs4 import CData, NavigableString
+import asyncio
+import io
 import json
-import time
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 def example_enhanced_basic_scraping():
     """Example 1: Enhanced basic web scraping with performance monitoring"""
     print("=== Example 1: Enhanced Basic Web Scraping ===")
@@ -20,7 +38,8 @@ def example_enhanced_basic_scraping():
         use_proxies=False,
         ignore_robots=True,
         use_selenium=False,
-        max_retries=3
+        max_retries=3,
+        use_cache=True  # Revalidate unchanged pages with If-None-Match on re-runs
     )
     
     try:
@@ -71,7 +90,8 @@ def example_enhanced_javascript_scraping():
         use_proxies=False,
         ignore_robots=True,
         use_selenium=True,  # Enable Selenium for JS rendering
-        max_retries=3
+        max_retries=3,
+        selenium_pool_size=2  # Keep Chrome warm for later Selenium scrapers in this process
     )
     
     try:
@@ -107,7 +127,9 @@ def example_enhanced_multiple_urls():
         use_proxies=False,
         ignore_robots=True,
         use_selenium=False,
-        max_retries=3
+        max_retries=3,
+        share_session=True,  # Reuse one connection pool across the examples
+        dns_cache=True  # Resolve each host once up front
     )
     
     try:
@@ -116,39 +138,67 @@ def example_enhanced_multiple_urls():
             "https://httpbin.org/html",
             "https://quotes.toscrape.com/",
             "https://httpbin.org/json",
-            "https://httpbin.org/xml"
+            "https://httpbin.org/xml",
+            "https://HTTPBIN.org/html?utm_source=newsletter#top"  # Same page as the first
         ]
         
+        # Collapse duplicates and trivial variants (case, fragments, tracking
+        # parameters) so each page is fetched once, remembering the originals
+        dedup_map = {}
+        for url in urls:
+            dedup_map.setdefault(normalize_url(url), []).append(url)
+        if len(dedup_map) < len(urls):
+            print(f"Skipping {len(urls) - len(dedup_map)} duplicate URL(s)")
+        urls = [originals[0] for originals in dedup_map.values()]
+        
         print(f"Scraping {len(urls)} URLs with enhanced monitoring...")
         
-        results = scraper.scrape_multiple(urls)
+        # Write each page as one JSON line as soon as it is scraped
+        with open("example3_enhanced_output.jsonl", "wb") as out:
+            def write_result(result):
+                out.write(json_dumps(result) + b'\n')
+            
+            # Fetch all URLs concurrently over one pooled async client when
+            # httpx is installed, otherwise fall back to sequential fetching
+            if HAS_HTTPX:
+                results = asyncio.run(scraper.scrape_multiple_async(
+                    urls, concurrency=16, on_result=write_result
+                ))
+            else:
+                results = scraper.scrape_multiple(urls, on_result=write_result)
         
         if results:
             print(f"✓ Successfully scraped {len(results)} URLs")
             
-            # Analyze results
-            total_quality_score = 0
-            valid_results = 0
-            total_content_length = 0
-            
+            # Build the per-URL report in memory and write it out in one go
+            report = []
             for i, result in enumerate(results, 1):
                 quality_score = result['validation']['quality_score']
                 is_valid = result['validation']['is_valid']
                 content_length = result['validation']['content_length']
                 
-                total_quality_score += quality_score
-                total_content_length += content_length
-                if is_valid:
-                    valid_results += 1
-                
-                print(f"  {i}. {result['url']}")
-                print(f"     Quality: {quality_score}/100, Valid: {is_valid}")
-                print(f"     Content: {content_length} chars, {len(result['paragraphs'])} paragraphs")
-            
-            # Summary statistics
-            avg_quality = total_quality_score / len(results)
-            success_rate = valid_results / len(results) * 100
-            avg_content_length = total_content_length / len(results)
+                report.append(f"  {i}. {result['url']}")
+                duplicates = dedup_map[normalize_url(result['url'])][1:]
+                if duplicates:
+                    report.append(f"     Also requested as: {', '.join(duplicates)}")
+                report.append(f"     Quality: {quality_score}/100, Valid: {is_valid}")
+                report.append(f"     Content: {content_length} chars, {len(result['paragraphs'])} paragraphs")
+            print('\n'.join(report))
+            
+            # Summary statistics, as vectorized reductions when NumPy is available
+            validations = [result['validation'] for result in results]
+            if HAS_NUMPY:
+                count = len(validations)
+                quality = np.fromiter((v['quality_score'] for v in validations), dtype=np.float64, count=count)
+                valid = np.fromiter((v['is_valid'] for v in validations), dtype=bool, count=count)
+                lengths = np.fromiter((v['content_length'] for v in validations), dtype=np.int64, count=count)
+                avg_quality = quality.mean()
+                success_rate = valid.mean() * 100
+                avg_content_length = lengths.mean()
+            else:
+                avg_quality = sum(v['quality_score'] for v in validations) / len(validations)
+                success_rate = sum(1 for v in validations if v['is_valid']) / len(validations) * 100
+                avg_content_length = sum(v['content_length'] for v in validations) / len(validations)
             
             print(f"\nSummary:")
             print(f"  Average Quality Score: {avg_quality:.1f}/100")
@@ -161,9 +211,7 @@ def example_enhanced_multiple_urls():
             print(f"    Success Rate: {metrics['success_rate']:.2%}")
             print(f"    Average Response Time: {metrics['average_response_time']:.2f}s")
             
-            # Save results
-            scraper.save_data(results, "example3_enhanced_output.json")
-            print("  Data saved to example3_enhanced_output.json")
+            print("  Data saved to example3_enhanced_output.jsonl")
         else:
             print("✗ No data scraped")
             
@@ -192,7 +240,8 @@ def example_enhanced_proxy_usage():
         proxy_list=proxy_list,
         ignore_robots=True,
         use_selenium=False,
-        max_retries=3
+        max_retries=3,
+        share_session=True  # Reuse one connection pool across the examples
     )
     
     try:
@@ -204,35 +253,46 @@ def example_enhanced_proxy_usage():
         
         print(f"Scraping {len(urls)} URLs with proxy rotation...")
         
-        for i, url in enumerate(urls, 1):
-            print(f"Scraping {i}/{len(urls)}: {url}")
-            
-            data = scraper.scrape(url)
-            
-            if data:
-                print(f"  ✓ Success - Quality: {data['validation']['quality_score']}")
+        # Start at most one request every ~2 seconds. Waiting for a slot
+        # doesn't block, so earlier requests keep running in the meantime
+        scraper.rate_limiter = AdaptiveRateLimiter(base_delay=2.0)
+        
+        async def scrape_politely(i, url):
+            await scraper.rate_limiter.acquire_async()
+            return i, url, await asyncio.to_thread(scraper.scrape, url)
+        
+        async def run_all():
+            results = []
+            # Create the tasks up front so they take rate-limit slots in order
+            tasks = [asyncio.create_task(scrape_politely(i, url))
+                     for i, url in enumerate(urls, 1)]
+            for finished in asyncio.as_completed(tasks):
+                i, url, data = await finished
+                print(f"Scraped {i}/{len(urls)}: {url}")
                 
-                # Show proxy information if available
-                if scraper.proxy_manager:
-                    proxy_metrics = []
-                    for proxy in scraper.proxy_manager.proxies:
-                        proxy_metrics.append({
-                            'url': proxy.url,
-                            'health': proxy.health,
-                            'response_time': proxy.response_time,
-                            'success_count': proxy.success_count,
-                            'failure_count': proxy.failure_count
-                        })
-                    print(f"  Proxy Metrics: {proxy_metrics}")
-            else:
-                print(f"  ✗ Failed")
-            
-            # Add delay between requests
-            if i < len(urls):
-                time.sleep(2)
+                if data:
+                    results.append(data)
+                    print(f"  ✓ Success - Quality: {data['validation']['quality_score']}")
+                    
+                    # Show proxy information if available
+                    if scraper.proxy_manager:
+                        proxy_metrics = []
+                        for proxy in scraper.proxy_manager.proxies:
+                            proxy_metrics.append({
+                                'url': proxy.url,
+                                'health': proxy.health,
+                                'response_time': proxy.response_time,
+                                'success_count': proxy.success_count,
+                                'failure_count': proxy.failure_count
+                            })
+                        print(f"  Proxy Metrics: {proxy_metrics}")
+                else:
+                    print(f"  ✗ Failed")
+            return results
+        
+        results = asyncio.run(run_all())
         
         # Save results
-        results = [data for data in [scraper.scrape(url) for url in urls] if data]
         if results:
             scraper.save_data(results, "example4_proxy_output.json")
             print("  Data saved to example4_proxy_output.json")
@@ -250,7 +310,8 @@ def example_enhanced_ethical_scraping():
         use_proxies=False,
         ignore_robots=False,  # Respect robots.txt
         use_selenium=False,
-        max_retries=2  # Fewer retries for ethical scraping
+        max_retries=2,  # Fewer retries for ethical scraping
+        use_cache=True  # Revalidate unchanged pages with If-None-Match on re-runs
     )
     
     try:
@@ -295,101 +356,148 @@ def example_enhanced_custom_extraction():
     print("=== Example 6: Enhanced Custom Data Extraction ===")
     
     class CustomEnhancedScraper(AdvancedWebScraper):
+        _EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+        _PHONE_RE = re.compile(r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+        _contact_db = None
+        
+        # Social platforms by domain, matched with one regex scan per link
+        _SOCIAL_PLATFORMS = {
+            'facebook.com': 'Facebook',
+            'twitter.com': 'Twitter',
+            'linkedin.com': 'LinkedIn',
+            'instagram.com': 'Instagram'
+        }
+        _SOCIAL_RE = re.compile('|'.join(map(re.escape, _SOCIAL_PLATFORMS)))
+        
         def extract_data(self, soup, url):
-            # Get the base data
+            # The base class walks the tree once and, through tag_extractors
+            # (set below), collects the custom fields in that same pass
             data = super().extract_data(soup, url)
             
             if not data:
                 return None
             
-            # Add custom extraction logic
-            data['custom_fields'] = {}
-            
-            # Extract social media links
-            social_links = []
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '').lower()
-                if any(social in href for social in ['facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com']):
-                    social_links.append({
-                        'platform': self._identify_social_platform(href),
-                        'url': link.get('href'),
-                        'text': link.get_text().strip()
-                    })
-            data['custom_fields']['social_links'] = social_links
-            
-            # Extract contact information
-            contact_info = self._extract_contact_info(soup)
-            data['custom_fields']['contact_info'] = contact_info
-            
-            # Extract meta tags for SEO analysis
-            seo_meta = self._extract_seo_meta(soup)
-            data['custom_fields']['seo_meta'] = seo_meta
+            # Extract contact information from the text gathered during the walk
+            custom_fields = self._custom_fields(data)
+            text = ''.join(custom_fields.pop('text'))
+            custom_fields['contact_info'] = self._extract_contact_info(text)
             
             return data
         
-        def _identify_social_platform(self, url):
-            """Identify social media platform from URL"""
-            if 'facebook.com' in url:
-                return 'Facebook'
-            elif 'twitter.com' in url:
-                return 'Twitter'
-            elif 'linkedin.com' in url:
-                return 'LinkedIn'
-            elif 'instagram.com' in url:
-                return 'Instagram'
-            else:
-                return 'Other'
+        @staticmethod
+        def _custom_fields(data):
+            """Get (creating on first use) the custom fields being collected for a page"""
+            custom_fields = data.get('custom_fields')
+            if custom_fields is None:
+                custom_fields = data['custom_fields'] = {
+                    'social_links': [],
+                    'seo_meta': {'open_graph': {}},
+                    'text': []
+                }
+            return custom_fields
+        
+        @classmethod
+        def _extract_social_link(cls, tag, data):
+            """Extract a link as usual, also recording it if it points to a social platform"""
+            AdvancedWebScraper.tag_extractors['a'](tag, data)
+            
+            href = tag.get('href')
+            match = cls._SOCIAL_RE.search(href.lower()) if href is not None else None
+            if match:
+                cls._custom_fields(data)['social_links'].append({
+                    'platform': cls._SOCIAL_PLATFORMS[match.group()],
+                    'url': href,
+                    'text': tag.get_text().strip()
+                })
         
-        def _extract_contact_info(self, soup):
-            """Extract contact information from page"""
+        @classmethod
+        def _extract_seo_meta(cls, tag, data):
+            """Extract a meta tag as usual, also recording SEO-related ones"""
+            AdvancedWebScraper.tag_extractors['meta'](tag, data)
+            seo_meta = cls._custom_fields(data)['seo_meta']
+            
+            name = tag.get('name')
+            if name in ('description', 'keywords'):
+                # Keep the first occurrence, like soup.find()
+                seo_meta.setdefault(name, tag.get('content', ''))
+            
+            property_name = tag.get('property')
+            if property_name and property_name.startswith('og:'):
+                seo_meta['open_graph'][property_name[3:]] = tag.get('content', '')
+        
+        @classmethod
+        def _collect_text(cls, element, data):
+            """Collect the text nodes soup.get_text() would join (no comments or scripts)"""
+            if type(element) in (NavigableString, CData):
+                cls._custom_fields(data)['text'].append(element)
+        
+        def _extract_contact_info(self, text):
+            """Extract contact information from page text"""
             contact_info = {
                 'emails': [],
                 'phones': [],
                 'addresses': []
             }
             
-            # Extract emails
-            import re
-            text = soup.get_text()
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, text)
-            contact_info['emails'] = list(set(emails))  # Remove duplicates
+            # Hyperscan's \b and \d are ASCII-only (UCP mode rejects \b), so
+            # non-ASCII pages go through re to keep both paths in agreement
+            if HAS_HYPERSCAN and text.isascii():
+                # Scan for emails and phone numbers in a single pass
+                emails, phones = self._scan_contact_info(text)
+            else:
+                emails = set(self._EMAIL_RE.findall(text))
+                phones = set(self._PHONE_RE.findall(text))
             
-            # Extract phone numbers
-            phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-            phones = re.findall(phone_pattern, text)
-            contact_info['phones'] = list(set(phones))
+            contact_info['emails'] = list(emails)  # Remove duplicates
+            contact_info['phones'] = list(phones)
             
             return contact_info
         
-        def _extract_seo_meta(self, soup):
-            """Extract SEO-related meta tags"""
-            seo_meta = {}
-            
-            # Meta description
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            if meta_desc:
-                seo_meta['description'] = meta_desc.get('content', '')
-            
-            # Meta keywords
-            meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-            if meta_keywords:
-                seo_meta['keywords'] = meta_keywords.get('content', '')
-            
-            # Open Graph tags
-            og_tags = {}
-            for tag in soup.find_all('meta', property=lambda x: x and x.startswith('og:')):
-                property_name = tag.get('property', '').replace('og:', '')
-                og_tags[property_name] = tag.get('content', '')
-            seo_meta['open_graph'] = og_tags
-            
-            return seo_meta
+        def _scan_contact_info(self, text):
+            """Find emails and phone numbers with one Hyperscan pass over the text"""
+            cls = type(self)
+            if cls._contact_db is None:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[cls._EMAIL_RE.pattern.encode(), cls._PHONE_RE.pattern.encode()],
+                    ids=[0, 1],
+                    flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * 2
+                )
+                cls._contact_db = db
+            
+            # Hyperscan reports every match end, so keep the longest match per
+            # start and drop overlaps to get the same results as re.findall
+            data = text.encode('ascii')
+            spans = {}
+            
+            def on_match(pattern_id, start, end, flags, context):
+                if end > spans.get((pattern_id, start), -1):
+                    spans[(pattern_id, start)] = end
+            
+            cls._contact_db.scan(data, match_event_handler=on_match)
+            
+            found = (set(), set())
+            last_end = [-1, -1]
+            for (pattern_id, start), end in sorted(spans.items()):
+                if start >= last_end[pattern_id]:
+                    found[pattern_id].add(data[start:end].decode('ascii'))
+                    last_end[pattern_id] = end
+            return found
+    
+    # Run the custom extractors in the base class's single pass over the tree
+    CustomEnhancedScraper.tag_extractors = {
+        **AdvancedWebScraper.tag_extractors,
+        'a': CustomEnhancedScraper._extract_social_link,
+        'meta': CustomEnhancedScraper._extract_seo_meta,
+        None: CustomEnhancedScraper._collect_text
+    }
     
     scraper = CustomEnhancedScraper(
         use_proxies=False,
         ignore_robots=True,
         use_selenium=False,
-        max_retries=3
+        max_retries=3,
+        use_cache=True  # Revalidate unchanged pages with If-None-Match on re-runs
     )
     
     try:
@@ -444,7 +552,8 @@ def example_enhanced_performance_monitoring():
         use_proxies=False,
         ignore_robots=True,
         use_selenium=False,
-        max_retries=3
+        max_retries=3,
+        share_session=True  # Reuse one connection pool across the examples
     )
     
     try:
@@ -459,31 +568,40 @@ def example_enhanced_performance_monitoring():
         
         print("Testing performance monitoring with various scenarios...")
         
-        for i, url in enumerate(urls, 1):
-            print(f"\nTest {i}/{len(urls)}: {url}")
-            
-            start_time = time.time()
-            data = scraper.scrape(url)
-            end_time = time.time()
-            
-            if data:
-                print(f"  ✓ Success")
-                print(f"    Response Time: {end_time - start_time:.2f}s")
-                print(f"    Quality Score: {data['validation']['quality_score']}")
-                print(f"    Content Length: {data['validation']['content_length']}")
-            else:
-                print(f"  ✗ Failed")
-                print(f"    Response Time: {end_time - start_time:.2f}s")
-            
-            # Show current metrics
-            metrics = scraper.get_performance_metrics()
-            print(f"    Current Success Rate: {metrics['success_rate']:.2%}")
-            print(f"    Average Response Time: {metrics['average_response_time']:.2f}s")
-            
-            # Check for alerts
-            alerts = scraper.get_alerts()
-            if alerts:
-                print(f"    ⚠️  Alerts: {alerts}")
+        async def timed_scrape(i, url):
+            # scrape() blocks, so run each one in a worker thread
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            data = await asyncio.to_thread(scraper.scrape, url)
+            return i, url, data, loop.time() - start_time
+        
+        async def run_all():
+            # Fire every test at once and report each one as it finishes
+            tasks = [timed_scrape(i, url) for i, url in enumerate(urls, 1)]
+            for finished in asyncio.as_completed(tasks):
+                i, url, data, elapsed = await finished
+                print(f"\nTest {i}/{len(urls)}: {url}")
+                
+                if data:
+                    print(f"  ✓ Success")
+                    print(f"    Response Time: {elapsed:.2f}s")
+                    print(f"    Quality Score: {data['validation']['quality_score']}")
+                    print(f"    Content Length: {data['validation']['content_length']}")
+                else:
+                    print(f"  ✗ Failed")
+                    print(f"    Response Time: {elapsed:.2f}s")
+                
+                # Show current metrics
+                metrics = scraper.get_performance_metrics()
+                print(f"    Current Success Rate: {metrics['success_rate']:.2%}")
+                print(f"    Average Response Time: {metrics['average_response_time']:.2f}s")
+                
+                # Check for alerts
+                alerts = scraper.get_alerts()
+                if alerts:
+                    print(f"    ⚠️  Alerts: {alerts}")
+        
+        asyncio.run(run_all())
         
         # Final performance summary
         print(f"\n=== Final Performance Summary ===")
@@ -502,6 +620,40 @@ def example_enhanced_performance_monitoring():
     
     print()
 
+class _PerThreadStdout:
+    """Send print() output to a per-thread buffer while one is set, else to the real stdout"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            with self._lock:
+                return self._stream.write(text)
+        return buffer.write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    def __getattr__(self, name):
+        # encoding, isatty(), fileno() etc. come from the real stream
+        return getattr(self._stream, name)
+    
+    def run_buffered(self, func):
+        """Run func, then print everything it printed as one uninterrupted block"""
+        self._local.buffer = io.StringIO()
+        try:
+            func()
+        finally:
+            output = self._local.buffer.getvalue()
+            self._local.buffer = None
+            with self._lock:
+                self._stream.write(output)
+                self._stream.flush()
+
 def main():
     """Run all enhanced examples"""
     print("🚀 Elite Web Scraper - Enhanced Examples")
@@ -517,15 +669,24 @@ def main():
         example_enhanced_performance_monitoring
     ]
     
-    for example in examples:
-        try:
-            example()
-        except Exception as e:
-            print(f"❌ Error in example: {e}")
-            print()
+    # The examples are network-bound and independent, so run them all at
+    # once; each one's output is buffered and printed when it finishes
+    stdout = _PerThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+            futures = {executor.submit(stdout.run_buffered, example): example.__name__
+                       for example in examples}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error in {futures[future]}: {e}")
+                    print()
+    finally:
+        sys.stdout = stdout._stream
     
     print("✅ All enhanced examples completed!")
 
 if __name__ == "__main__":
     main()
-
@@ -1,29 +1,77 @@
 import os
-import json
 import time
+import re
+import sys
 import uuid
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, send_file, session
+from flask import Flask, render_template, request, jsonify, session, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit, join_room, leave_room
 import threading
-from advanced_scraper import AdvancedWebScraper
+import gzip
+import itertools
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from advanced_scraper import AdaptiveRateLimiter, AdvancedWebScraper, PerformanceMonitor, ProxyManager, json_dumps, json_loads, normalize_url
 import logging
 from werkzeug.utils import secure_filename
 import zipfile
 import tempfile
 import hashlib
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Any, ClassVar, Dict, Iterable, List, Optional
+from dataclasses import dataclass, asdict, field
 import csv
 import io
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize jsonify responses and request bodies with orjson when available"""
+    
+    def dumps(self, obj, **kwargs):
+        try:
+            return json_dumps(obj, indent='indent' in kwargs).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        return json_loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = json_dumps(obj, indent=indent)
+        except TypeError:
+            # Types only Flask's encoder knows (dates, dataclasses, ...)
+            return super().response(*args, **kwargs)
+        # Bytes go straight into the response without a str round trip
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-secret-key-here')
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['RESULTS_FOLDER'] = 'results'
 
-# Initialize SocketIO for real-time updates with threading async mode
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading', logger=False, engineio_logger=False)
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+# Shared job state for multi-process deployments; unset keeps jobs in-process only
+REDIS_URL = os.environ.get('REDIS_URL')
+
+# startup.py selects 'gevent' when it serves the app from a gevent WSGIServer
+ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')
+USE_GEVENT = ASYNC_MODE == 'gevent'
+if USE_GEVENT:
+    import gevent
+
+# Initialize SocketIO for real-time updates. With Redis, emits go through it as a
+# message queue so clients connected to any process get every job's updates.
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE, logger=False, engineio_logger=False,
+                    message_queue=REDIS_URL if REDIS_URL and HAS_REDIS else None)
 
 # Ensure directories exist
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -33,9 +81,39 @@ os.makedirs(app.config['RESULTS_FOLDER'], exist_ok=True)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    from flask_compress import Compress
+    HAS_FLASK_COMPRESS = True
+except ImportError:
+    HAS_FLASK_COMPRESS = False
+    logger.warning("Flask-Compress not available, responses will be sent uncompressed")
+
+if HAS_FLASK_COMPRESS:
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    # Compressing a streamed download would buffer all of it first
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
+
 # Store active scraping jobs with enhanced tracking
 active_jobs = {}
 
+# Shared worker threads for scraping jobs; extra submissions queue until one is free.
+# These stay OS threads under gevent, so scraping never blocks the event loop.
+JOB_POOL = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('SCRAPER_WORKERS', 16)),
+    thread_name_prefix='scrape'
+)
+
+if USE_GEVENT:
+    _EVENT_LOOP = gevent.get_hub().loop
+
+def _on_event_loop(func, *args):
+    """Run func on the server's event loop; gevent sockets must not be used from job threads"""
+    if USE_GEVENT:
+        _EVENT_LOOP.run_callback_threadsafe(func, *args)
+    else:
+        func(*args)
+
 @dataclass
 class ScrapingJob:
     job_id: str
@@ -49,6 +127,29 @@ class ScrapingJob:
     end_time: Optional[datetime] = None
     performance_metrics: Dict[str, Any] = None
     alerts: List[str] = None
+    duplicates: List[str] = None
+    future: Optional[Any] = None
+    # Clock pair recorded once at creation; event times are stored as
+    # monotonic ns and only turned into wall-clock strings for output
+    start_ns: int = field(default_factory=time.monotonic_ns, repr=False)
+    start_wall: float = field(default_factory=time.time, repr=False)
+    _size_bytes: int = field(default=0, init=False, repr=False)
+    _sized_results: int = field(default=0, init=False, repr=False)
+    last_emit_ts: float = field(default=0.0, init=False, repr=False)
+    last_emit_status: Optional[str] = field(default=None, init=False, repr=False)
+    pending_message: Optional[str] = field(default=None, init=False, repr=False)
+    _dict_cache: Optional[tuple] = field(default=None, init=False, repr=False)
+    
+    # Assigning any of these invalidates the cached to_dict()
+    _DICT_FIELDS: ClassVar[frozenset] = frozenset({
+        'job_id', 'status', 'progress', 'urls', 'results', 'errors',
+        'start_time', 'end_time', 'performance_metrics', 'alerts', 'duplicates'
+    })
+    
+    def __setattr__(self, name, value):
+        if name in self._DICT_FIELDS:
+            object.__setattr__(self, '_dict_cache', None)
+        object.__setattr__(self, name, value)
     
     def __post_init__(self):
         if self.results is None:
@@ -61,8 +162,85 @@ class ScrapingJob:
             self.performance_metrics = {}
         if self.alerts is None:
             self.alerts = []
+        if self.duplicates is None:
+            self.duplicates = []
+    
+    def estimated_bytes(self) -> int:
+        """Rough in-memory size of the job's results
+        
+        Only results added since the last call are measured, so calling this
+        repeatedly on a growing job stays cheap.
+        """
+        if self._sized_results > len(self.results):
+            # Results were replaced rather than appended to
+            self._size_bytes = self._sized_results = 0
+        for result in self.results[self._sized_results:]:
+            self._size_bytes += len(json_dumps(result))
+        self._sized_results = len(self.results)
+        return sys.getsizeof(self.results) + self._size_bytes
+    
+    def to_state(self) -> Dict[str, Any]:
+        """Everything needed to rebuild the job with from_state, as JSON-friendly values"""
+        return {
+            'job_id': self.job_id,
+            'urls': self.urls,
+            'config': self.config,
+            'status': self.status,
+            'progress': self.progress,
+            'results': self.results,
+            'errors': self.errors,
+            'start_time': self.start_time.isoformat(),
+            'end_time': self.end_time.isoformat() if self.end_time else None,
+            'performance_metrics': self.performance_metrics,
+            'alerts': self.alerts,
+            'duplicates': self.duplicates,
+            'start_ns': self.start_ns,
+            'start_wall': self.start_wall,
+            'results_file': getattr(self, 'results_file', None)
+        }
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'ScrapingJob':
+        state = dict(state)
+        results_file = state.pop('results_file', None)
+        state['start_time'] = datetime.fromisoformat(state['start_time'])
+        if state['end_time']:
+            state['end_time'] = datetime.fromisoformat(state['end_time'])
+        job = cls(**state)
+        if results_file:
+            job.results_file = results_file
+        return job
+    
+    def iso_from_ns(self, ts_ns: int) -> str:
+        """ISO wall-clock time for a time.monotonic_ns() reading taken during the job"""
+        return datetime.fromtimestamp(self.start_wall + (ts_ns - self.start_ns) / 1e9).isoformat()
+    
+    def output_errors(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """The first count errors (default all), with monotonic ts_ns replaced by an ISO timestamp"""
+        output = []
+        for error in itertools.islice(self.errors, count):
+            if 'ts_ns' in error:
+                ts_ns = error['ts_ns']
+                error = {key: value for key, value in error.items() if key != 'ts_ns'}
+                error['timestamp'] = self.iso_from_ns(ts_ns)
+            output.append(error)
+        return output
+    
+    def etag(self) -> str:
+        """Validator for to_dict(); changes whenever the summary can"""
+        return (f"{self.status}-{self.progress}-{len(self.results)}-{len(self.errors)}"
+                f"-{len(self.duplicates)}-{len(self.alerts)}")
     
     def to_dict(self):
+        """Summary of the job, rebuilt only when it has changed since the last call"""
+        # These lists grow in place, so their lengths are part of the key
+        key = (len(self.results), len(self.errors), len(self.duplicates))
+        if self._dict_cache is None or self._dict_cache[0] != key:
+            self._dict_cache = (key, self._build_dict())
+        # Callers add keys (e.g. 'message'), so hand out a copy
+        return dict(self._dict_cache[1])
+    
+    def _build_dict(self):
         return {
             'job_id': self.job_id,
             'status': self.status,
@@ -70,19 +248,171 @@ class ScrapingJob:
             'total_urls': len(self.urls),
             'completed_urls': len(self.results),
             'errors': len(self.errors),
+            'duplicates': len(self.duplicates),
             'start_time': self.start_time.isoformat(),
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'results_count': len(self.results),
             'performance_metrics': self.performance_metrics,
             'alerts': self.alerts,
-            'success_rate': (len(self.results) / len(self.urls) * 100) if self.urls else 0
+            'success_rate': self.success_rate()
         }
+    
+    def success_rate(self, results_count: Optional[int] = None) -> float:
+        """Percent of URLs fetched successfully, out of results_count results (default all)
+        
+        Skipped duplicates were fetched fine, so they count as successes.
+        """
+        if not self.urls:
+            return 0
+        if results_count is None:
+            results_count = len(self.results)
+        return (results_count + len(self.duplicates)) / len(self.urls) * 100
+
+REDIS_JOB_TTL = int(os.environ.get('REDIS_JOB_TTL', 86400))
+
+# Entries fetched per LRANGE when streaming a shared job's results or errors
+REDIS_PAGE_SIZE = 500
+
+# Seconds progress writes are buffered before going to Redis in one pipeline
+SHARE_INTERVAL = 0.25
+
+class RedisListView(Sequence):
+    """Read-only view of the first `length` entries of a JSON-encoded Redis list
+    
+    Nothing is fetched until the view is iterated or sliced, and then only
+    REDIS_PAGE_SIZE entries per round trip, so len() and truthiness are free.
+    """
+    
+    def __init__(self, client, key: str, length: int):
+        self.client = client
+        self.key = key
+        self.length = length
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __iter__(self):
+        for start in range(0, self.length, REDIS_PAGE_SIZE):
+            stop = min(start + REDIS_PAGE_SIZE, self.length)
+            page = self.client.lrange(self.key, start, stop - 1)
+            yield from map(json_loads, page)
+            if len(page) < stop - start:
+                # The list expired mid-read
+                return
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                return list(self)[index]
+            if start >= stop:
+                return []
+            return [json_loads(item) for item in self.client.lrange(self.key, start, stop - 1)]
+        
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('list index out of range')
+        page = self.client.lrange(self.key, index, index)
+        if not page:
+            raise IndexError('list index out of range')
+        return json_loads(page[0])
+
+class RedisJobStore:
+    """Job state shared through Redis so any app process can serve any job
+    
+    Metadata lives in the hash `job:<id>` (one JSON-encoded value per
+    to_state() field), results and errors in the lists `job:<id>:results`
+    and `job:<id>:errors`. Keys expire REDIS_JOB_TTL seconds after the
+    job's last write.
+    """
+    
+    # Fields that change while a job runs; the rest are written once
+    PROGRESS_FIELDS = ('status', 'progress', 'end_time', 'performance_metrics',
+                       'alerts', 'duplicates', 'results_file')
+    
+    def __init__(self, url: str, ttl: int = REDIS_JOB_TTL):
+        self.redis = redis.Redis.from_url(url)
+        self.ttl = ttl
+    
+    def _keys(self, job_id: str):
+        return f"job:{job_id}", f"job:{job_id}:results", f"job:{job_id}:errors"
+    
+    def save(self, job: ScrapingJob, fields=None, items: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        """Write the job's metadata (all of it, or only `fields`)
+        
+        New entries in `items` ({'results': [...], 'errors': [...]}) are
+        appended to the job's lists first, in the same round trip.
+        """
+        state = job.to_state()
+        del state['results'], state['errors']
+        if fields:
+            state = {field_name: state[field_name] for field_name in fields}
+        
+        meta_key, results_key, errors_key = self._keys(job.job_id)
+        pipe = self.redis.pipeline(transaction=False)
+        for kind, entries in (items or {}).items():
+            if entries:
+                pipe.rpush(f"job:{job.job_id}:{kind}", *map(json_dumps, entries))
+        pipe.hset(meta_key, mapping={key: json_dumps(value) for key, value in state.items()})
+        for key in (meta_key, results_key, errors_key):
+            pipe.expire(key, self.ttl)
+        pipe.execute()
+    
+    def load(self, job_id: str) -> Optional[ScrapingJob]:
+        """Rebuild a job written by any process, or None if it is unknown or expired
+        
+        Only the metadata and list lengths are read; results and errors are
+        RedisListViews fetched page by page if an endpoint iterates them.
+        """
+        meta_key, results_key, errors_key = self._keys(job_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(meta_key)
+        pipe.llen(results_key)
+        pipe.llen(errors_key)
+        meta, results_count, errors_count = pipe.execute()
+        if not meta:
+            return None
+        
+        state = {key.decode(): json_loads(value) for key, value in meta.items()}
+        state['results'] = RedisListView(self.redis, results_key, results_count)
+        state['errors'] = RedisListView(self.redis, errors_key, errors_count)
+        return ScrapingJob.from_state(state)
+
+# Memory budget for finished jobs' results; older ones are spilled to disk
+JOB_CACHE_BYTES = int(os.environ.get('JOB_CACHE_BYTES', 512 * 1024 * 1024))
 
 class EnhancedScrapingManager:
-    """Enhanced scraping manager with performance monitoring"""
+    """Enhanced scraping manager with performance monitoring
+    
+    Queued and running jobs live in `active` and are never evicted. Finished
+    jobs move to `jobs`, an LRU holding at most `cache_bytes` of results
+    (always at least the most recent job); the least recently used are
+    written to `<spill_folder>/<job_id>.json.gz`, leaving
+    only their summary in memory, and are reloaded on the next lookup.
+    Jobs with a socket client in their room are never evicted, and jobs
+    whose last client left are the first to go.
+    """
     
-    def __init__(self):
-        self.jobs = {}
+    def __init__(self, cache_bytes: int = JOB_CACHE_BYTES, spill_folder: str = app.config['RESULTS_FOLDER'],
+                 store: Optional[RedisJobStore] = None):
+        self.active = {}
+        self.jobs = OrderedDict()
+        self.archived = {}  # job_id -> to_dict() summary of spilled jobs
+        self._spilling = {}
+        self.room_membership = {}  # job_id -> number of joined clients
+        self._client_rooms = {}  # socket sid -> job_ids it joined
+        self.cache_bytes = cache_bytes
+        self.cache_bytes_used = 0
+        self.store = store
+        self.spill_folder = spill_folder
+        self._lock = threading.Lock()
+        # job_id -> (job, unsent results/errors) waiting for the share thread
+        self._share_pending = {}
+        self._share_ready = threading.Condition()
+        # Held while writing, so a job's final save lands after its buffered ones
+        self._share_write_lock = threading.Lock()
+        self._share_thread = None
         self.global_metrics = {
             'total_jobs': 0,
             'active_jobs': 0,
@@ -94,28 +424,262 @@ class EnhancedScrapingManager:
     def create_job(self, job_id: str, urls: List[str], config: Dict[str, Any]) -> ScrapingJob:
         """Create a new scraping job"""
         job = ScrapingJob(job_id=job_id, urls=urls, config=config)
-        self.jobs[job_id] = job
-        self.global_metrics['total_jobs'] += 1
-        self.global_metrics['active_jobs'] += 1
+        with self._lock:
+            self.active[job_id] = job
+            self.global_metrics['total_jobs'] += 1
+            self.global_metrics['active_jobs'] += 1
+        self.share_now(job, full=True)
         return job
     
+    def share(self, job: ScrapingJob, kind: str = None, item: Dict[str, Any] = None):
+        """Queue a job's progress (and a new result or error) for the shared store, if any
+        
+        This runs on the scraper's event loop, so it never touches Redis: a
+        background thread sends each job's buffered entries and progress in
+        one pipeline every SHARE_INTERVAL.
+        """
+        if self.store is None:
+            return
+        with self._share_ready:
+            pending = self._share_pending.get(job.job_id)
+            if pending is None:
+                pending = self._share_pending[job.job_id] = (job, {'results': [], 'errors': []})
+            if kind:
+                pending[1][kind].append(item)
+            if self._share_thread is None:
+                self._share_thread = threading.Thread(target=self._share_loop, name='redis-share', daemon=True)
+                self._share_thread.start()
+            self._share_ready.notify()
+    
+    def share_now(self, job: ScrapingJob, full: bool = False):
+        """Write a job's buffered entries and its metadata (all of it if `full`) before returning"""
+        if self.store is None:
+            return
+        with self._share_write_lock:
+            with self._share_ready:
+                pending = self._share_pending.pop(job.job_id, None)
+            self._write_shared(job, pending[1] if pending else None, full)
+    
+    def _write_shared(self, job: ScrapingJob, items, full: bool):
+        try:
+            self.store.save(job, None if full else RedisJobStore.PROGRESS_FIELDS, items)
+        except redis.RedisError as e:
+            logger.error(f"Failed to share job {job.job_id} through Redis: {e}")
+    
+    def _share_loop(self):
+        """Flush buffered progress to the shared store, SHARE_INTERVAL apart"""
+        while True:
+            with self._share_ready:
+                while not self._share_pending:
+                    self._share_ready.wait()
+            # Let the batch fill up before sending it
+            time.sleep(SHARE_INTERVAL)
+            with self._share_write_lock:
+                with self._share_ready:
+                    batch, self._share_pending = self._share_pending, {}
+                for job, items in batch.values():
+                    self._write_shared(job, items, False)
+    
+    def finish_job(self, job: ScrapingJob):
+        """Move a completed, failed or cancelled job into the LRU of finished jobs"""
+        # Measure outside the lock; on_result has already sized most results
+        size = job.estimated_bytes()
+        with self._lock:
+            if self.active.pop(job.job_id, None) is None:
+                return
+            self.global_metrics['active_jobs'] -= 1
+            self._cache(job, size)
+            evicted = self._evict()
+        self.share_now(job)
+        self._spill(evicted)
+    
+    def _cache(self, job: ScrapingJob, size: int):
+        """Add a finished job of estimated_bytes() size to the LRU (call with the lock held)"""
+        self.jobs[job.job_id] = job
+        # Finished jobs no longer grow, so their size is fixed from here on
+        self.cache_bytes_used += size
+    
+    def _evict(self) -> List[ScrapingJob]:
+        """Pop least recently used finished jobs over the budget (call with the lock held)"""
+        evicted = []
+        if self.cache_bytes_used <= self.cache_bytes:
+            return evicted
+        
+        # Walk LRU order, skipping the newest job and any a client is watching
+        for job_id in list(self.jobs)[:-1]:
+            if self.cache_bytes_used <= self.cache_bytes:
+                break
+            if self.room_membership.get(job_id):
+                continue
+            old_job = self.jobs.pop(job_id)
+            self.cache_bytes_used -= old_job.estimated_bytes()
+            # Still served from memory until it is on disk
+            self._spilling[old_job.job_id] = old_job
+            evicted.append(old_job)
+        return evicted
+    
+    def _spill_path(self, job_id: str) -> str:
+        return os.path.join(self.spill_folder, f"{job_id}.json.gz")
+    
+    def _spill(self, evicted: List[ScrapingJob]):
+        """Write evicted jobs to disk, keeping only their summaries in memory"""
+        for job in evicted:
+            try:
+                with gzip.open(self._spill_path(job.job_id), 'wb') as f:
+                    f.write(json_dumps(job.to_state()))
+            except OSError as e:
+                logger.error(f"Failed to spill job {job.job_id} to disk: {e}")
+                with self._lock:
+                    self._spilling.pop(job.job_id, None)
+                continue
+            
+            with self._lock:
+                self.archived[job.job_id] = job.to_dict()
+                self._spilling.pop(job.job_id, None)
+    
+    def _load(self, job_id: str) -> Optional[ScrapingJob]:
+        """Reload a spilled job from disk"""
+        try:
+            with gzip.open(self._spill_path(job_id), 'rb') as f:
+                state = json_loads(f.read())
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load job {job_id} from disk: {e}")
+            return None
+        return ScrapingJob.from_state(state)
+    
+    def _load_shared(self, job_id: str) -> Optional[ScrapingJob]:
+        if self.store is None:
+            return None
+        try:
+            return self.store.load(job_id)
+        except redis.RedisError as e:
+            logger.error(f"Failed to load job {job_id} from Redis: {e}")
+            return None
+    
+    def join(self, sid: str, job_id: str):
+        """Record a socket client joining a job's room"""
+        with self._lock:
+            rooms = self._client_rooms.setdefault(sid, set())
+            if job_id not in rooms:
+                rooms.add(job_id)
+                self.room_membership[job_id] = self.room_membership.get(job_id, 0) + 1
+    
+    def leave(self, sid: str, job_id: str):
+        """Record a socket client leaving a job's room"""
+        with self._lock:
+            rooms = self._client_rooms.get(sid)
+            if not rooms or job_id not in rooms:
+                return
+            rooms.discard(job_id)
+            if not rooms:
+                del self._client_rooms[sid]
+            self._release(job_id)
+            evicted = self._evict()
+        self._spill(evicted)
+    
+    def disconnect(self, sid: str):
+        """Drop every room a disconnected socket client had joined"""
+        with self._lock:
+            for job_id in self._client_rooms.pop(sid, ()):
+                self._release(job_id)
+            evicted = self._evict()
+        self._spill(evicted)
+    
+    def _release(self, job_id: str):
+        """Decrement a room's membership (call with the lock held)"""
+        count = self.room_membership.get(job_id, 0) - 1
+        if count > 0:
+            self.room_membership[job_id] = count
+            return
+        self.room_membership.pop(job_id, None)
+        if job_id in self.jobs:
+            # Nobody is watching any more, so make it the next to evict
+            self.jobs.move_to_end(job_id, last=False)
+    
     def update_job_metrics(self, job_id: str, scraper: AdvancedWebScraper):
         """Update job with scraper performance metrics"""
-        if job_id in self.jobs:
-            job = self.jobs[job_id]
+        job = self.active.get(job_id)
+        if job:
             job.performance_metrics = scraper.get_performance_metrics()
             job.alerts = scraper.get_alerts()
     
     def get_job(self, job_id: str) -> Optional[ScrapingJob]:
-        """Get job by ID"""
-        return self.jobs.get(job_id)
+        """Get job by ID, reloading it from disk if it was spilled
+        
+        Jobs owned by another process are read from the shared store on
+        every call, so they are never stale; only their metadata is fetched
+        up front (see RedisJobStore.load).
+        """
+        with self._lock:
+            job = self.active.get(job_id) or self._spilling.get(job_id)
+            if job:
+                return job
+            job = self.jobs.get(job_id)
+            if job:
+                self.jobs.move_to_end(job_id)
+                return job
+            spilled = job_id in self.archived
+        
+        if not spilled:
+            return self._load_shared(job_id)
+        
+        job = self._load(job_id)
+        if job is None:
+            return None
+        size = job.estimated_bytes()
+        with self._lock:
+            if job_id in self.jobs:
+                # Another request reloaded it first
+                return self.jobs[job_id]
+            self.archived.pop(job_id, None)
+            self._cache(job, size)
+            evicted = self._evict()
+        self._spill(evicted)
+        return job
+    
+    def state_tag(self) -> str:
+        """Short tag that changes whenever job_summaries() or the global metrics would"""
+        with self._lock:
+            # Finished jobs never change, so counting them is enough
+            active = tuple(
+                (job.job_id, job.status, job.progress, len(job.results), len(job.errors))
+                for job in self.active.values()
+            )
+            finished = len(self.jobs) + len(self._spilling) + len(self.archived)
+            metrics = tuple(self.global_metrics.values())
+        return hashlib.blake2b(repr((active, finished, metrics)).encode(), digest_size=8).hexdigest()
+    
+    def job_summaries(self) -> List[Dict[str, Any]]:
+        """Summaries of every known job, oldest first"""
+        with self._lock:
+            summaries = [job.to_dict() for job in self.active.values()]
+            summaries += [job.to_dict() for job in self.jobs.values()]
+            summaries += [job.to_dict() for job in self._spilling.values()]
+            summaries += list(self.archived.values())
+        summaries.sort(key=lambda summary: summary['start_time'])
+        return summaries
     
     def get_global_metrics(self) -> Dict[str, Any]:
         """Get global performance metrics"""
         return self.global_metrics.copy()
 
 # Initialize enhanced scraping manager
-scraping_manager = EnhancedScrapingManager()
+if REDIS_URL and not HAS_REDIS:
+    logger.warning("REDIS_URL is set but redis is not installed, jobs will not be shared between processes")
+scraping_manager = EnhancedScrapingManager(
+    store=RedisJobStore(REDIS_URL) if REDIS_URL and HAS_REDIS else None
+)
+
+# http(s) URL with a host and no whitespace
+_URL_RE = re.compile(r'^https?://[^\s/?#]+[^\s]*$', re.IGNORECASE)
+
+def _clean_urls(candidates: List[str]) -> tuple:
+    """Drop invalid and repeated URLs, keeping first-seen order
+    
+    Returns (urls, invalid_count).
+    """
+    valid = [url for url in candidates if _URL_RE.match(url)]
+    return list(dict.fromkeys(valid)), len(candidates) - len(valid)
 
 @app.route('/')
 def index():
@@ -129,17 +693,21 @@ def start_scraping():
         data = request.json
         
         # Extract URLs
-        urls = []
+        submitted = []
         if data.get('urls'):
             # Multiple URLs from textarea
-            urls = [url.strip() for url in data['urls'].split('\n') if url.strip()]
+            submitted = [url.strip() for url in data['urls'].split('\n') if url.strip()]
         elif data.get('single_url'):
             # Single URL
-            urls = [data['single_url'].strip()]
+            submitted = [data['single_url'].strip()]
         
-        if not urls:
+        if not submitted:
             return jsonify({'error': 'No URLs provided'}), 400
         
+        urls, invalid_count = _clean_urls(submitted)
+        if not urls:
+            return jsonify({'error': 'No valid URLs provided', 'invalid_count': invalid_count}), 400
+        
         # Enhanced configuration
         config = {
             'use_proxies': data.get('use_proxies', False),
@@ -149,22 +717,24 @@ def start_scraping():
             'delay_min': float(data.get('delay_min', 1)),
             'delay_max': float(data.get('delay_max', 3)),
             'max_retries': int(data.get('max_retries', 3)),
-            'timeout': int(data.get('timeout', 30))
+            'timeout': int(data.get('timeout', 30)),
+            'concurrency': max(1, int(data.get('concurrency', 16))),
+            'deduplicate': bool(data.get('deduplicate', True))
         }
         
         # Create job
         job_id = str(uuid.uuid4())
         job = scraping_manager.create_job(job_id, urls, config)
         
-        # Start scraping in background thread
-        thread = threading.Thread(target=run_enhanced_scraping_job, args=(job,))
-        thread.daemon = True
-        thread.start()
+        # Run the job on the shared worker pool
+        job.future = JOB_POOL.submit(run_enhanced_scraping_job, job)
         
         return jsonify({
             'job_id': job_id,
             'status': 'started',
             'total_urls': len(urls),
+            'deduped_from': len(submitted),
+            'invalid_count': invalid_count,
             'message': f'Started scraping {len(urls)} URLs'
         })
         
@@ -172,60 +742,122 @@ def start_scraping():
         logger.error(f"Error starting scraping job: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Distinct scraper configs kept warm; the least recently used beyond this are closed
+SCRAPER_POOL_CONFIGS = int(os.environ.get('SCRAPER_POOL_CONFIGS', 32))
+
+_idle_scrapers = OrderedDict()  # config key -> idle scrapers, least recently used first
+_idle_scrapers_lock = threading.Lock()
+
+def _borrow_scraper(config: Dict[str, Any]) -> tuple:
+    """Take an idle scraper built for the same settings, or build one
+    
+    Returns (pool key, scraper); hand both to _release_scraper when done.
+    """
+    kwargs = {
+        'use_proxies': config.get('use_proxies', False),
+        'proxy_list': config.get('proxy_list', []),
+        'ignore_robots': config.get('ignore_robots', True),
+        'use_selenium': config.get('use_selenium', False),
+        'max_retries': config.get('max_retries', 3)
+    }
+    key = tuple((name, tuple(value) if isinstance(value, list) else value) for name, value in kwargs.items())
+    
+    with _idle_scrapers_lock:
+        idle = _idle_scrapers.get(key)
+        scraper = idle.pop() if idle else None
+    
+    if scraper is None:
+        return key, AdvancedWebScraper(**kwargs)
+    # Keep the warm session, robots and DNS caches; pacing, proxy health and
+    # metrics are per job, so a slow or failing last job can't drag this one
+    scraper.rate_limiter = AdaptiveRateLimiter()
+    if scraper.proxy_manager is not None:
+        scraper.proxy_manager = ProxyManager(kwargs['proxy_list'])
+    scraper.performance_monitor = PerformanceMonitor()
+    return key, scraper
+
+def _release_scraper(key: tuple, scraper: AdvancedWebScraper):
+    """Return a scraper to the idle pool for the next job with the same settings"""
+    with _idle_scrapers_lock:
+        _idle_scrapers.setdefault(key, []).append(scraper)
+        _idle_scrapers.move_to_end(key)
+        evicted = []
+        while len(_idle_scrapers) > SCRAPER_POOL_CONFIGS:
+            _, scrapers = _idle_scrapers.popitem(last=False)
+            evicted.extend(scrapers)
+    
+    for old_scraper in evicted:
+        old_scraper.close()
+
 def run_enhanced_scraping_job(job: ScrapingJob):
     """Run enhanced scraping job with performance monitoring"""
+    scraper = None
     try:
         job.status = 'running'
         emit_job_update(job, "Starting scraping job...")
         
-        # Initialize scraper with enhanced configuration
-        scraper = AdvancedWebScraper(
-            use_proxies=job.config.get('use_proxies', False),
-            proxy_list=job.config.get('proxy_list', []),
-            ignore_robots=job.config.get('ignore_robots', True),
-            use_selenium=job.config.get('use_selenium', False),
-            max_retries=job.config.get('max_retries', 3)
-        )
+        # Reuse a warm scraper with the same configuration when one is idle
+        scraper_key, scraper = _borrow_scraper(job.config)
+        
+        # Drop URLs that only differ by case, fragment or tracking parameters
+        seen = set()
+        unique_urls = []
+        for url in job.urls:
+            key = normalize_url(url)
+            if key not in seen:
+                seen.add(key)
+                unique_urls.append(url)
+        job.urls = unique_urls
+        scraping_manager.share_now(job, full=True)
         
         total_urls = len(job.urls)
+        emit_job_update(job, f"Scraping {total_urls} URLs...")
         
-        for i, url in enumerate(job.urls, 1):
-            try:
-                # Update progress
-                job.progress = int((i - 1) / total_urls * 100)
-                emit_job_update(job, f"Scraping {i}/{total_urls}: {url}")
-                
-                # Scrape URL
-                data = scraper.scrape(url)
-                
-                if data:
-                    job.results.append(data)
-                    emit_job_update(job, f"Successfully scraped: {url}")
-                else:
-                    error_info = {
-                        'url': url,
-                        'error': 'Failed to scrape data',
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    job.errors.append(error_info)
-                    emit_job_update(job, f"Failed to scrape: {url}")
-                
-                # Update job metrics
-                scraping_manager.update_job_metrics(job.job_id, scraper)
-                
-                # Add delay between requests
-                if i < total_urls:
-                    delay = scraper.rate_limiter.adjust_delay(True)
-                    time.sleep(delay)
-                
-            except Exception as e:
-                error_info = {
-                    'url': url,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                }
-                job.errors.append(error_info)
-                emit_job_update(job, f"Error scraping {url}: {str(e)}")
+        def record_progress(kind=None, item=None):
+            done = len(job.results) + len(job.errors) + len(job.duplicates)
+            job.progress = int(done / total_urls * 100)
+            scraping_manager.update_job_metrics(job.job_id, scraper)
+            scraping_manager.share(job, kind, item)
+        
+        # Mirrors often serve the same page under different URLs; the
+        # extractor's content_hash identifies them without hashing again
+        deduplicate = job.config.get('deduplicate', True)
+        seen_hashes = set()
+        
+        def on_result(data):
+            content_hash = data.get('content_hash')
+            if deduplicate and content_hash:
+                if content_hash in seen_hashes:
+                    job.duplicates.append(data['url'])
+                    record_progress()
+                    emit_job_update(job, f"Skipped duplicate content: {data['url']}")
+                    return
+                seen_hashes.add(content_hash)
+            
+            job.results.append(data)
+            # Size each result as it arrives so finishing the job stays cheap
+            job.estimated_bytes()
+            record_progress('results', data)
+            emit_job_update(job, f"Successfully scraped: {data['url']}")
+        
+        def on_error(url):
+            error = {
+                'url': url,
+                'error': 'Failed to scrape data',
+                'ts_ns': time.monotonic_ns()
+            }
+            job.errors.append(error)
+            record_progress('errors', error)
+            emit_job_update(job, f"Failed to scrape: {url}")
+        
+        # Fetch concurrently (bounded by the job's concurrency) when the
+        # scraper's async path applies; the rate limiter paces requests
+        scraper.scrape_multiple(
+            job.urls,
+            on_result=on_result,
+            on_error=on_error,
+            concurrency=job.config.get('concurrency', 16)
+        )
         
         # Finalize job
         job.status = 'completed'
@@ -233,7 +865,6 @@ def run_enhanced_scraping_job(job: ScrapingJob):
         job.end_time = datetime.now()
         
         # Update global metrics
-        scraping_manager.global_metrics['active_jobs'] -= 1
         scraping_manager.global_metrics['total_urls_scraped'] += len(job.results)
         
         # Save results
@@ -244,22 +875,77 @@ def run_enhanced_scraping_job(job: ScrapingJob):
             job.results_file = filepath
         
         emit_job_update(job, "Scraping job completed!")
-        scraper.close()
+        _release_scraper(scraper_key, scraper)
         
     except Exception as e:
         job.status = 'failed'
         job.end_time = datetime.now()
         emit_job_update(job, f"Job failed: {str(e)}")
         logger.error(f"Scraping job failed: {e}")
+        # Its state is unknown after a failure, so don't hand it to another job
+        if scraper is not None:
+            scraper.close()
+    
+    finally:
+        scraping_manager.finish_job(job)
+
+# Progress updates for a job are sent at most this often (seconds)
+EMIT_INTERVAL = 0.1
+
+_pending_emits = {}  # job_id -> job with a coalesced update waiting to be sent
+_emit_lock = threading.Lock()
+_emit_flusher_started = False
 
 def emit_job_update(job: ScrapingJob, message: str = None):
-    """Emit job update via WebSocket"""
+    """Emit job update via WebSocket
+    
+    Updates arriving within EMIT_INTERVAL of the previous one are coalesced
+    and sent by a background flusher, keeping only the latest message.
+    Status changes are always sent immediately.
+    """
+    global _emit_flusher_started
+    now = time.monotonic()
+    with _emit_lock:
+        if job.status == job.last_emit_status and now - job.last_emit_ts < EMIT_INTERVAL:
+            job.pending_message = message
+            _pending_emits[job.job_id] = job
+            if not _emit_flusher_started:
+                _emit_flusher_started = True
+                _on_event_loop(socketio.start_background_task, _flush_job_updates)
+            return
+        
+        _pending_emits.pop(job.job_id, None)
+        job.pending_message = None
+        job.last_emit_ts = now
+        job.last_emit_status = job.status
+    
+    _send_job_update(job, message)
+
+def _flush_job_updates():
+    """Background task sending coalesced job updates every EMIT_INTERVAL"""
+    while True:
+        socketio.sleep(EMIT_INTERVAL)
+        with _emit_lock:
+            pending = list(_pending_emits.values())
+            _pending_emits.clear()
+            now = time.monotonic()
+            updates = []
+            for job in pending:
+                updates.append((job, job.pending_message))
+                job.pending_message = None
+                job.last_emit_ts = now
+                job.last_emit_status = job.status
+        
+        for job, message in updates:
+            _send_job_update(job, message)
+
+def _send_job_update(job: ScrapingJob, message: str = None):
     try:
         job_data = job.to_dict()
         if message:
             job_data['message'] = message
         
-        socketio.emit('job_update', job_data, room=job.job_id)
+        _on_event_loop(lambda: socketio.emit('job_update', job_data, room=job.job_id))
     except Exception as e:
         logger.error(f"Error emitting job update: {e}")
 
@@ -270,6 +956,36 @@ def get_job_status(job_id):
     if not job:
         return jsonify({'error': 'Job not found'}), 404
     
+    return _conditional_json(job.etag(), job.to_dict)
+
+def _conditional_json(tag: str, build):
+    """jsonify(build()) with a weak ETag, or an empty 304 if the client already has it"""
+    # Flask-Compress appends ':gzip' (etc.) to the tags it sends out
+    if request.if_none_match.star_tag or any(
+        candidate.split(':', 1)[0] == tag for candidate in request.if_none_match.as_set(include_weak=True)
+    ):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(build())
+    response.set_etag(tag, weak=True)
+    # Cacheable, but always revalidated, so browsers send If-None-Match themselves
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/api/job/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Cancel a job that is still waiting for a worker"""
+    job = scraping_manager.get_job(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    if not job.future or not job.future.cancel():
+        return jsonify({'error': f'Job cannot be cancelled (status: {job.status})'}), 409
+    
+    job.status = 'cancelled'
+    job.end_time = datetime.now()
+    scraping_manager.finish_job(job)
+    emit_job_update(job, "Scraping job cancelled")
     return jsonify(job.to_dict())
 
 @app.route('/api/job/<job_id>/results')
@@ -279,23 +995,42 @@ def get_job_results(job_id):
     if not job:
         return jsonify({'error': 'Job not found'}), 404
     
-    # Enhanced results with quality analysis
-    enhanced_results = []
-    for result in job.results:
-        enhanced_result = result.copy()
-        if 'validation' in result:
-            enhanced_result['quality_score'] = result['validation']['quality_score']
-            enhanced_result['is_valid'] = result['validation']['is_valid']
-            enhanced_result['issues'] = result['validation']['issues']
-        
-        enhanced_results.append(enhanced_result)
-    
-    return jsonify({
-        'job_id': job_id,
-        'results': enhanced_results,
-        'total_results': len(enhanced_results),
-        'success_rate': len(enhanced_results) / len(job.urls) * 100 if job.urls else 0
-    })
+    # Snapshot the count; a running job keeps appending while we stream
+    total = len(job.results)
+    summary = {
+        'total_results': total,
+        'success_rate': job.success_rate(total)
+    }
+    return Response(
+        stream_with_context(_generate_results(job_id, itertools.islice(job.results, total), summary)),
+        mimetype='application/json'
+    )
+
+def _quality_fields(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Validation fields lifted to the top level of an API result"""
+    validation = result.get('validation')
+    if validation is None:
+        return {}
+    return {
+        'quality_score': validation['quality_score'],
+        'is_valid': validation['is_valid'],
+        'issues': validation['issues']
+    }
+
+def _generate_results(job_id: str, results, summary: Dict[str, Any]):
+    """Yield the results API response, building each enhanced result as it is sent"""
+    chunk = [b'{"job_id":' + json_dumps(job_id) + b',"results":[']
+    size = 0
+    for i, result in enumerate(results):
+        item = json_dumps({**result, **_quality_fields(result)})
+        chunk.append(item if i == 0 else b',' + item)
+        size += len(item)
+        if size >= DOWNLOAD_CHUNK_SIZE:
+            yield b''.join(chunk)
+            chunk, size = [], 0
+    # Splice the summary fields in after the results
+    chunk.append(b'],' + json_dumps(summary)[1:] + b'\n')
+    yield b''.join(chunk)
 
 @app.route('/api/job/<job_id>/download')
 def download_results(job_id):
@@ -307,35 +1042,60 @@ def download_results(job_id):
     if not job.results:
         return jsonify({'error': 'No results available'}), 404
     
-    # Create enhanced output with metadata
-    output_data = {
-        'metadata': {
-            'job_id': job_id,
-            'scraped_at': datetime.now().isoformat(),
-            'total_urls': len(job.urls),
-            'successful_scrapes': len(job.results),
-            'failed_scrapes': len(job.errors),
-            'success_rate': len(job.results) / len(job.urls) * 100 if job.urls else 0,
-            'performance_metrics': job.performance_metrics,
-            'alerts': job.alerts,
-            'job_duration': (job.end_time - job.start_time).total_seconds() if job.end_time else 0
-        },
-        'results': job.results,
-        'errors': job.errors
-    }
+    # A running job keeps appending; stream only what the metadata counts
+    total_results = len(job.results)
+    total_errors = len(job.errors)
     
-    # Create file in memory
-    output = io.StringIO()
-    json.dump(output_data, output, indent=2, ensure_ascii=False)
-    output.seek(0)
+    metadata = {
+        'job_id': job_id,
+        'scraped_at': datetime.now().isoformat(),
+        'total_urls': len(job.urls),
+        'successful_scrapes': total_results,
+        'failed_scrapes': total_errors,
+        'success_rate': job.success_rate(total_results),
+        'performance_metrics': job.performance_metrics,
+        'alerts': job.alerts,
+        'job_duration': (job.end_time - job.start_time).total_seconds() if job.end_time else 0
+    }
     
-    return send_file(
-        io.BytesIO(output.getvalue().encode('utf-8')),
+    return Response(
+        stream_with_context(_generate_json(
+            metadata,
+            itertools.islice(job.results, total_results),
+            job.output_errors(total_errors)
+        )),
         mimetype='application/json',
-        as_attachment=True,
-        download_name=f'scraping_results_{job_id}.json'
+        headers={'Content-Disposition': f'attachment; filename=scraping_results_{job_id}.json'}
     )
 
+# Streamed downloads are flushed to the client in chunks of about this size
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+def _dump_indented(obj, depth: int) -> str:
+    """Indented JSON for obj as it would appear nested `depth` levels deep"""
+    return json_dumps(obj, indent=True).decode('utf-8').replace('\n', '\n' + '  ' * depth)
+
+def _generate_json(metadata: Dict[str, Any], results: Iterable[Dict[str, Any]], errors: Iterable[Dict[str, Any]]):
+    """Yield the JSON download one item at a time instead of as one document"""
+    yield '{\n  "metadata": ' + _dump_indented(metadata, 1)
+    
+    for key, items in (('results', results), ('errors', errors)):
+        chunk = [f',\n  "{key}": [']
+        size = 0
+        empty = True
+        for item in items:
+            text = _dump_indented(item, 2)
+            chunk.append(('\n    ' if empty else ',\n    ') + text)
+            empty = False
+            size += len(text)
+            if size >= DOWNLOAD_CHUNK_SIZE:
+                yield ''.join(chunk)
+                chunk, size = [], 0
+        chunk.append(']' if empty else '\n  ]')
+        yield ''.join(chunk)
+    
+    yield '\n}'
+
 @app.route('/api/job/<job_id>/download-csv')
 def download_results_csv(job_id):
     """Download results as CSV with enhanced formatting"""
@@ -346,42 +1106,49 @@ def download_results_csv(job_id):
     if not job.results:
         return jsonify({'error': 'No results available'}), 404
     
-    # Create CSV output
+    return Response(
+        stream_with_context(_generate_csv(job.results)),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename=scraping_results_{job_id}.csv'}
+    )
+
+_CSV_HEADER = (
+    'URL', 'Title', 'Meta Description', 'Paragraphs Count',
+    'Links Count', 'Images Count', 'Quality Score', 'Is Valid', 'Issues'
+)
+
+# Rows handed to writerows per streamed chunk
+CSV_BATCH_ROWS = 500
+
+def _csv_row(result: Dict[str, Any]) -> tuple:
+    """One CSV row for a scraped result, in _CSV_HEADER order"""
+    validation = result.get('validation', {})
+    return (
+        result.get('url', ''),
+        result.get('title', ''),
+        result.get('meta_description', ''),
+        len(result.get('paragraphs', [])),
+        len(result.get('links', [])),
+        len(result.get('images', [])),
+        validation.get('quality_score', 0),
+        validation.get('is_valid', False),
+        '; '.join(validation.get('issues', []))
+    )
+
+def _generate_csv(results: List[Dict[str, Any]]):
+    """Yield the CSV download CSV_BATCH_ROWS rows at a time"""
     output = io.StringIO()
     writer = csv.writer(output)
+    writer.writerow(_CSV_HEADER)
     
-    # Write header
-    writer.writerow([
-        'URL', 'Title', 'Meta Description', 'Paragraphs Count', 
-        'Links Count', 'Images Count', 'Quality Score', 'Is Valid', 'Issues'
-    ])
-    
-    # Write data rows
-    for result in job.results:
-        quality_score = result.get('validation', {}).get('quality_score', 0)
-        is_valid = result.get('validation', {}).get('is_valid', False)
-        issues = '; '.join(result.get('validation', {}).get('issues', []))
-        
-        writer.writerow([
-            result.get('url', ''),
-            result.get('title', ''),
-            result.get('meta_description', ''),
-            len(result.get('paragraphs', [])),
-            len(result.get('links', [])),
-            len(result.get('images', [])),
-            quality_score,
-            is_valid,
-            issues
-        ])
-    
-    output.seek(0)
-    
-    return send_file(
-        io.BytesIO(output.getvalue().encode('utf-8')),
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=f'scraping_results_{job_id}.csv'
-    )
+    for start in range(0, len(results), CSV_BATCH_ROWS):
+        writer.writerows(map(_csv_row, results[start:start + CSV_BATCH_ROWS]))
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+    
+    if output.tell():
+        yield output.getvalue()
 
 @app.route('/api/upload-urls', methods=['POST'])
 def upload_urls():
@@ -400,12 +1167,9 @@ def upload_urls():
             file.save(filepath)
             
             # Read URLs from file
-            urls = []
             with open(filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    url = line.strip()
-                    if url and url.startswith(('http://', 'https://')):
-                        urls.append(url)
+                submitted = [line.strip() for line in f if line.strip()]
+            urls, invalid_count = _clean_urls(submitted)
             
             # Clean up uploaded file
             os.remove(filepath)
@@ -413,6 +1177,8 @@ def upload_urls():
             return jsonify({
                 'urls': urls,
                 'count': len(urls),
+                'deduped_from': len(submitted),
+                'invalid_count': invalid_count,
                 'message': f'Successfully loaded {len(urls)} URLs'
             })
     
@@ -423,11 +1189,15 @@ def upload_urls():
 @app.route('/api/analytics')
 def get_analytics():
     """Get global analytics and performance metrics"""
+    return _conditional_json(scraping_manager.state_tag(), _build_analytics)
+
+def _build_analytics() -> Dict[str, Any]:
     global_metrics = scraping_manager.get_global_metrics()
     
     # Calculate additional metrics
-    active_jobs = [job for job in scraping_manager.jobs.values() if job.status == 'running']
-    completed_jobs = [job for job in scraping_manager.jobs.values() if job.status == 'completed']
+    summaries = scraping_manager.job_summaries()
+    active_jobs = [job for job in summaries if job['status'] == 'running']
+    completed_jobs = [job for job in summaries if job['status'] == 'completed']
     
     analytics = {
         'global_metrics': global_metrics,
@@ -435,17 +1205,17 @@ def get_analytics():
         'completed_jobs_count': len(completed_jobs),
         'recent_jobs': [
             {
-                'job_id': job.job_id,
-                'status': job.status,
-                'total_urls': len(job.urls),
-                'success_rate': len(job.results) / len(job.urls) * 100 if job.urls else 0,
-                'start_time': job.start_time.isoformat()
+                'job_id': job['job_id'],
+                'status': job['status'],
+                'total_urls': job['total_urls'],
+                'success_rate': job['success_rate'],
+                'start_time': job['start_time']
             }
-            for job in list(scraping_manager.jobs.values())[-10:]  # Last 10 jobs
+            for job in summaries[-10:]  # Last 10 jobs
         ]
     }
     
-    return jsonify(analytics)
+    return analytics
 
 @socketio.on('join_job')
 def on_join_job(data):
@@ -453,6 +1223,7 @@ def on_join_job(data):
     job_id = data.get('job_id')
     if job_id:
         join_room(job_id)
+        scraping_manager.join(request.sid, job_id)
         emit('status', {'message': f'Joined job room: {job_id}'})
 
 @socketio.on('leave_job')
@@ -461,15 +1232,27 @@ def on_leave_job(data):
     job_id = data.get('job_id')
     if job_id:
         leave_room(job_id)
+        scraping_manager.leave(request.sid, job_id)
         emit('status', {'message': f'Left job room: {job_id}'})
 
+@socketio.on('disconnect')
+def on_disconnect():
+    """Release the job rooms of a disconnected client"""
+    scraping_manager.disconnect(request.sid)
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
-        'active_jobs': scraping_manager.global_metrics['active_jobs']
+        'active_jobs': scraping_manager.global_metrics['active_jobs'],
+        'job_cache': {
+            'bytes_used': scraping_manager.cache_bytes_used,
+            'bytes_limit': scraping_manager.cache_bytes,
+            'cached_jobs': len(scraping_manager.jobs),
+            'spilled_jobs': len(scraping_manager.archived)
+        }
     })
 
 if __name__ == '__main__':
@@ -4,22 +4,98 @@ from bs4 import BeautifulSoup
 import json
 import time
 import random
-from fake_useragent import UserAgent
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    from selectolax.parser import HTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+class _SelectolaxNode:
+    """Minimal BeautifulSoup-style view of a selectolax node"""
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    def get_text(self):
+        return self.node.text()
+
+class _SelectolaxSoup:
+    """Wraps a selectolax tree so callers can keep using find_all"""
+
+    def __init__(self, html_content):
+        self.tree = HTMLParser(html_content)
+
+    def find_all(self, name):
+        return [_SelectolaxNode(node) for node in self.tree.css(name)]
+
+# Rotated per request; a fixed list avoids loading fake_useragent's data on startup
+_UA_POOL = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 OPR/106.0.0.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (iPad; CPU OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
+    'Mozilla/5.0 (Linux; Android 14; SM-S918B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
+)
+
+_BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
 
 class WebScraper:
     def __init__(self):
-        self.session = requests.Session()
-        self.ua = UserAgent()
+        if HAS_HTTPX:
+            # One pooled client for every scrape; HTTP/2 multiplexes same-host requests
+            # over a single connection (which manages keep-alive itself)
+            headers = {k: v for k, v in _BASE_HEADERS.items() if k != 'Connection'}
+            self.session = httpx.Client(
+                http2=HAS_HTTP2,
+                headers=headers,
+                timeout=10,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+            )
+            self._fetch_errors = (httpx.HTTPError,)
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(_BASE_HEADERS)
+            self._fetch_errors = (requests.exceptions.RequestException,)
 
     def _get_headers(self):
-        return {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        # The base headers are set on the session; only the User-Agent rotates
+        return {'User-Agent': random.choice(_UA_POOL)}
 
     def fetch_page(self, url):
         try:
@@ -27,12 +103,17 @@ class WebScraper:
             response = self.session.get(url, headers=headers, timeout=10)
             response.raise_for_status()  # Raise an HTTPError for bad responses (4xx or 5xx)
             return response.text
-        except requests.exceptions.RequestException as e:
+        except self._fetch_errors as e:
             print(f"Error fetching {url}: {e}")
             return None
 
+    def close(self):
+        self.session.close()
+
     def parse_html(self, html_content):
         if html_content:
+            if HAS_SELECTOLAX:
+                return _SelectolaxSoup(html_content)
             return BeautifulSoup(html_content, 'lxml')
         return None
 
@@ -52,6 +133,7 @@ if __name__ == "__main__":
     # Example usage: Replace with a URL you want to scrape
     example_url = "https://www.google.com"
     data = scraper.scrape(example_url)
+    scraper.close()
     if data:
         print("Scraped data:")
         print(json.dumps(data, indent=2))
@@ -7,7 +7,27 @@ Handles both development and production environments
 import os
 import sys
 import logging
-from flask_scraper_app import app, socketio
+
+# Serve HTTP and WebSockets from greenlets. The standard library is not
+# monkey-patched: scraping jobs run their own asyncio loops on OS threads,
+# which gevent's patched threading and subprocess modules would break.
+# That also rules gevent out with REDIS_URL, whose message-queue listener
+# blocks on a plain socket and would stall the unpatched event loop.
+try:
+    from gevent.pywsgi import WSGIServer
+    HAS_GEVENT = True
+    if not os.environ.get('REDIS_URL'):
+        os.environ.setdefault('SOCKETIO_ASYNC_MODE', 'gevent')
+except ImportError:
+    HAS_GEVENT = False
+
+try:
+    from geventwebsocket.handler import WebSocketHandler
+    HAS_GEVENT_WEBSOCKET = True
+except ImportError:
+    HAS_GEVENT_WEBSOCKET = False
+
+from flask_scraper_app import app, socketio, USE_GEVENT
 
 # Configure logging for production
 logging.basicConfig(
@@ -17,6 +37,11 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+if not HAS_GEVENT:
+    logger.warning("gevent not available. Serving with threads instead of greenlets")
+elif not HAS_GEVENT_WEBSOCKET:
+    logger.warning("gevent-websocket not available. Clients will fall back to long-polling")
+
 def main():
     """Main startup function"""
     port = int(os.environ.get('PORT', 5000))
@@ -27,6 +52,14 @@ def main():
     logger.info(f"Debug mode: {debug}")
     logger.info(f"Python version: {sys.version}")
     
+    if USE_GEVENT:
+        # Greenlet server: thousands of WebSocket clients on one process
+        handler_class = WebSocketHandler if HAS_GEVENT_WEBSOCKET else None
+        server = WSGIServer((host, port), app, handler_class=handler_class, log=None)
+        logger.info("Serving with gevent")
+        server.serve_forever()
+        return
+    
     try:
         # Try to use socketio.run first (preferred for WebSocket support)
         socketio.run(
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Parity checks for the page extractors
+
+The lxml fast path must produce exactly what the BeautifulSoup walk does,
+down to the content hash, or pages stop deduplicating against each other
+when a scraper switches between the default and a customised extractor.
+"""
+
+import unittest
+
+from bs4 import BeautifulSoup
+
+from advanced_scraper import HAS_LXML, HTML_PARSER, _extract_page_data, _extract_page_data_lxml
+
+# Inline script, style and template content that get_text() leaves out
+FIXTURE_HTML = """<!DOCTYPE html>
+<html>
+<head>
+  <title>Parity Fixture</title>
+  <meta name="description" content=" Fixture for the extractor parity tests ">
+  <style>body { color: red; }</style>
+  <script type="application/ld+json">{"@type": "Article", "name": "first"}</script>
+</head>
+<body>
+  <h1>Head<style>.a{color:red}</style>line</h1>
+  <p>hello <script>var x=1;</script> world, with enough text</p>
+  <p>Paragraph with <b>bold</b> and <noscript>noscript</noscript> text</p>
+  <template>
+    <p>This paragraph lives inside a template</p>
+    <h2>Template heading</h2>
+    <a href="/template-link">Template link</a>
+    <img src="template.png" alt="in template">
+    text between<style>.b{}</style>template children
+  </template>
+  <p>Before a template<template>hidden</template> and after it</p>
+  <h2>Second <!-- comment -->heading</h2>
+  <a href="/page"> Link<script>document.write('x')</script> text </a>
+  <a href="/empty"><script>only script</script></a>
+  <img src="photo.jpg" alt=" A photo ">
+  <script type="application/ld+json">{"@type": "Person", "name": "second"}</script>
+  <script type="application/ld+json">not json</script>
+</body>
+</html>
+"""
+
+@unittest.skipUnless(HAS_LXML, "lxml is not installed")
+class ExtractorParityTest(unittest.TestCase):
+    """The lxml and BeautifulSoup extractors agree field for field"""
+    
+    def assert_parity(self, html):
+        expected = _extract_page_data(BeautifulSoup(html, HTML_PARSER), 'https://example.com/')
+        actual = _extract_page_data_lxml(html, 'https://example.com/')
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual['content_hash'], expected['content_hash'])
+        return actual
+    
+    def test_fixture_matches(self):
+        data = self.assert_parity(FIXTURE_HTML)
+        # Sanity-check that the fixture exercises what it is meant to
+        self.assertIn({'level': 1, 'text': 'Headline'}, data['headings'])
+        self.assertIn('hello  world, with enough text', data['paragraphs'])
+        self.assertNotIn('This paragraph lives inside a template', data['paragraphs'])
+        self.assertEqual([item['name'] for item in data['structured_data']], ['first', 'second'])
+    
+    def test_bytes_input_matches(self):
+        self.assert_parity(FIXTURE_HTML.encode('utf-8'))
+    
+    def test_non_ascii_bytes_match(self):
+        html = '<meta charset="iso-8859-1"><p>Caf\xe9 cr\xe8me br\xfbl\xe9e, tr\xe8s bien</p>'
+        self.assert_parity(html.encode('iso-8859-1'))
+
+if __name__ == "__main__":
+    unittest.main()